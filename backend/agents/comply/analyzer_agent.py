@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from google.adk.agents import LlmAgent
 from schemas.agent_outputs import SinglePolicyAnalysis
 
@@ -15,6 +16,7 @@ def sanitize_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=128)
 def create_policy_analyzer(policy_name: str) -> LlmAgent:
     """
     Creates an analyzer agent instance for a specific bank policy.
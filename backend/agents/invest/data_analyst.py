@@ -12,6 +12,7 @@ from google.genai.types import ThinkingConfig
 from schemas.invest import MarketDataAnalysisOutput
 from tools.yfinance_tools import (
     get_stock_quote,
+    get_stock_quotes,
     get_stock_fundamentals,
     get_price_history,
     get_analyst_ratings,
@@ -37,6 +38,7 @@ data_search_agent = Agent(
     output_key="market_data_analysis_raw",
     tools=[
         get_stock_quote,
+        get_stock_quotes,
         get_stock_fundamentals, 
         get_price_history,
         get_analyst_ratings,
@@ -1,5 +1,7 @@
 """Prompts for all investment strategy agents - JSON structured output"""
 
+from functools import lru_cache
+
 INVESTMENT_COORDINATOR_PROMPT = """
 Role: Investment strategy coordinator for portfolio managers.
 Your goal is to orchestrate sub-agents to generate comprehensive investment strategies.
@@ -14,10 +16,11 @@ Execute these steps in order:
 
 1. Call data_search_agent with the ticker/sector to gather real financial data and news.
 2. Call data_format_agent to structure the gathered data into JSON.
-3. Call visualization_agent to decide what charts and visualizations to generate.
-4. Call trading_analyst to generate strategies based on the data + user profile.
-5. Call execution_analyst to create execution plans.
-6. Call risk_analyst to assess overall risk.
+3. In a single turn, call BOTH visualization_agent (to decide what charts and visualizations to generate)
+   and trading_analyst (to generate strategies based on the data + user profile). They only need the
+   formatted market data, so issue the two calls together rather than waiting for one to finish.
+4. Call execution_analyst to create execution plans.
+5. Call risk_analyst to assess overall risk.
 
 After all sub-agents complete, confirm completion.
 """
@@ -26,6 +29,7 @@ DATA_ANALYST_PROMPT = """
 Agent Role: Market Data Analyst
 Tools Available:
 - get_stock_quote: Get current price, P/E, market cap, 52-week range
+- get_stock_quotes: Get quotes for several tickers in one call
 - get_stock_fundamentals: Get revenue, margins, debt ratios, growth metrics
 - get_price_history: Get historical prices for charts (use period="3mo")
 - get_analyst_ratings: Get analyst price targets and recommendations
@@ -40,7 +44,7 @@ Process for STOCK TICKERS (e.g., AAPL, MSFT, GOOGL):
 
 Process for SECTORS (e.g., "Technology", "Banking"):
 1. Use google_search to identify top companies in the sector
-2. Call get_stock_quote on 2-3 major companies in that sector
+2. Call get_stock_quotes once with 2-3 major companies in that sector
 3. Call google_search for sector news and trends
 
 Output a comprehensive report including:
@@ -240,3 +244,38 @@ If no numerical data suitable for charting is available, return empty visualizat
 Include reasoning explaining why you chose these visualizations.
 """
 
+
+HORIZON_TEXT = {
+    "short": "short-term (less than 1 year)",
+    "medium": "medium-term (1-3 years)",
+    "long": "long-term (3+ years)"
+}
+
+STRATEGY_REQUEST_PROMPT = """Generate an investment strategy with the following parameters:
+
+Ticker/Sector: {{ticker_or_sector}}
+Risk Tolerance: {risk_tolerance}
+Investment Horizon: {investment_horizon}
+Focusing on Aspect (if any, else none): {{focus_text}}
+
+Please proceed through all 5 steps:
+1. Gather raw market data (data_search_agent)
+2. Format data into JSON (data_format_agent)
+3. Develop 3-5 trading strategies (trading_analyst)
+4. Create detailed execution plan (execution_analyst)
+5. Evaluate overall risk (risk_analyst)
+
+Confirm when done."""
+
+
+@lru_cache(maxsize=None)
+def get_strategy_request_prompt(risk_tolerance: str, investment_horizon: str) -> str:
+    """Coordinator request template with the user profile already substituted.
+
+    Only ticker_or_sector and focus_text remain as placeholders, so each of the
+    nine risk/horizon profiles is rendered once per process.
+    """
+    return STRATEGY_REQUEST_PROMPT.format(
+        risk_tolerance=risk_tolerance,
+        investment_horizon=HORIZON_TEXT[investment_horizon]
+    )
@@ -6,6 +6,9 @@ bundle = joblib.load(MODEL_PATH)
 model = bundle["model"]
 MODEL_AUC = bundle.get("auc", None)
 
+_CLASS_IDX = {int(c): i for i, c in enumerate(model.classes_)}
+_HIGH_IDX = _CLASS_IDX.get(2)
+
 
 def ml_score(features):
     """Get ML score from feature vector.
@@ -14,12 +17,7 @@ def ml_score(features):
         tuple: (probability_high_risk, score_0_1000)
     """
     probs = model.predict_proba([features])[0]
-    
-    if 2 in list(model.classes_):
-        high_idx = list(model.classes_).index(2)
-        prob_high = float(probs[high_idx])
-    else:
-        prob_high = float(max(probs))
+    prob_high = float(probs[_HIGH_IDX]) if _HIGH_IDX is not None else float(probs.max())
 
     score = int(prob_high * 1000)
     return prob_high, score
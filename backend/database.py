@@ -1,46 +1,370 @@
 import sqlite3
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from datetime import datetime
-import json
-from contextlib import contextmanager
+import orjson
 
 
 DB_PATH = Path(__file__).parent / "data" / "finguard.db"
 
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
 
-def get_connection():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+CREATED_AT_ISO = "strftime('%Y-%m-%dT%H:%M:%f', created_at / 1000.0, 'unixepoch')"
+
+_wal_enabled = False
+_local = threading.local()
+
+
+def _configure(conn: sqlite3.Connection) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _open_connection():
+    global _wal_enabled
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False, cached_statements=256)
+    if not _wal_enabled:
+        # page_size and auto_vacuum only apply to a fresh file and must precede the
+        # switch to WAL, which is then persisted in the database header.
+        conn.execute("PRAGMA page_size=4096")
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    return _configure(conn)
+
+
+def _open_read_connection():
+    return _configure(sqlite3.connect(
+        f"{DB_PATH.as_uri()}?mode=ro", uri=True, check_same_thread=False, cached_statements=256
+    ))
+
+
+def _thread_connection(name: str, opener) -> sqlite3.Connection:
+    conn = getattr(_local, name, None)
+    if conn is None:
+        conn = opener()
+        setattr(_local, name, conn)
     return conn
 
 
-@contextmanager
-def get_db():
-    conn = get_connection()
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
-
-
-def init_db():
-    with get_db() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS analyses (
-                id TEXT PRIMARY KEY,
-                filename TEXT NOT NULL,
-                regulation_title TEXT,
-                regulation_reference TEXT,
-                overall_status TEXT NOT NULL,
-                gaps_count INTEGER NOT NULL DEFAULT 0,
-                action_items_count INTEGER NOT NULL DEFAULT 0,
-                processing_time REAL,
-                report_json TEXT,
-                created_at TEXT NOT NULL
+def get_connection():
+    return _thread_connection("conn", _open_connection)
+
+
+def get_read_connection():
+    return _thread_connection("reader", _open_read_connection)
+
+
+def run_maintenance():
+    # executescript steps incremental_vacuum to completion; execute() would free a single page.
+    get_connection().executescript("""
+        PRAGMA incremental_vacuum;
+        PRAGMA optimize;
+        PRAGMA wal_checkpoint(TRUNCATE);
+    """)
+
+
+ALL_DDL = (
+    """
+        CREATE TABLE IF NOT EXISTS analyses (
+            id TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            regulation_title TEXT,
+            regulation_reference TEXT,
+            overall_status TEXT NOT NULL,
+            gaps_count INTEGER NOT NULL DEFAULT 0,
+            action_items_count INTEGER NOT NULL DEFAULT 0,
+            processing_time REAL,
+            report_json TEXT,
+            created_at INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER))
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS investment_strategies (
+            id TEXT PRIMARY KEY,
+            ticker_or_sector TEXT NOT NULL,
+            risk_tolerance TEXT NOT NULL,
+            investment_horizon TEXT NOT NULL,
+            focus_areas TEXT,
+            strategy_name TEXT,
+            strategy_json TEXT,
+            processing_time REAL,
+            created_at INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER))
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS fraud_transactions (
+            id TEXT PRIMARY KEY,
+            transaction_id TEXT UNIQUE NOT NULL,
+            amount REAL NOT NULL,
+            type TEXT NOT NULL,
+            source_account_id TEXT,
+            destination_name TEXT,
+            risk_score INTEGER,
+            verdict TEXT,
+            fraud_type TEXT,
+            tier_reached INTEGER,
+            rule_flags TEXT,
+            ml_score REAL,
+            ml_features TEXT,
+            ai_reasoning TEXT,
+            processing_time_ms REAL,
+            transaction_json TEXT,
+            created_at INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER))
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS credit_assessments (
+            id TEXT PRIMARY KEY,
+            assessment_id TEXT UNIQUE NOT NULL,
+            user_id TEXT NOT NULL,
+            age INTEGER,
+            occupation TEXT,
+            monthly_income REAL,
+            final_score INTEGER,
+            risk_band TEXT,
+            reason_codes TEXT,
+            rule_score INTEGER,
+            ml_score INTEGER,
+            ml_probability REAL,
+            processing_time_ms REAL,
+            applicant_json TEXT,
+            created_at INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER))
+        )
+    """,
+)
+
+ALL_INDEXES = (
+    """
+        CREATE INDEX IF NOT EXISTS idx_analyses_created
+        ON analyses(created_at DESC)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_investment_strategies_created
+        ON investment_strategies(created_at DESC)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_fraud_created_at
+        ON fraud_transactions(created_at DESC)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_fraud_verdict
+        ON fraud_transactions(verdict)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_fraud_fraud_type
+        ON fraud_transactions(fraud_type)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_credit_created_at
+        ON credit_assessments(created_at DESC)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_credit_risk_band
+        ON credit_assessments(risk_band)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_credit_user_id
+        ON credit_assessments(user_id)
+    """,
+)
+
+
+SQL_INSERT_ANALYSIS = """
+    INSERT INTO analyses (
+        id, filename, regulation_title, regulation_reference,
+        overall_status, gaps_count, action_items_count,
+        processing_time, report_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_SELECT_ANALYSES = f"""
+    SELECT id, filename, regulation_title, regulation_reference,
+           overall_status, gaps_count, action_items_count,
+           processing_time, {CREATED_AT_ISO} AS created_at
+    FROM analyses
+    ORDER BY analyses.created_at DESC, analyses.rowid DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_ANALYSIS_BY_ID = """
+    SELECT * FROM analyses WHERE id = ?
+"""
+
+SQL_INSERT_INVESTMENT_STRATEGY = """
+    INSERT INTO investment_strategies (
+        id, ticker_or_sector, risk_tolerance, investment_horizon,
+        focus_areas, strategy_name, strategy_json, processing_time
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_SELECT_INVESTMENT_STRATEGIES = f"""
+    SELECT id, ticker_or_sector, strategy_name, risk_tolerance,
+           investment_horizon, processing_time, {CREATED_AT_ISO} AS created_at
+    FROM investment_strategies
+    ORDER BY investment_strategies.created_at DESC, investment_strategies.rowid DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_INVESTMENT_STRATEGY_BY_ID = """
+    SELECT * FROM investment_strategies WHERE id = ?
+"""
+
+SQL_INSERT_FRAUD = """
+    INSERT INTO fraud_transactions (
+        id, transaction_id, amount, type, source_account_id,
+        destination_name, risk_score, verdict, fraud_type, tier_reached,
+        rule_flags, ml_score, ml_features, ai_reasoning,
+        processing_time_ms, transaction_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_SELECT_FRAUD = f"""
+    SELECT id, transaction_id, amount, type, destination_name,
+           risk_score, verdict, fraud_type, {CREATED_AT_ISO} AS created_at
+    FROM fraud_transactions
+    ORDER BY fraud_transactions.created_at DESC, fraud_transactions.rowid DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_FRAUD_BY_ID = """
+    SELECT * FROM fraud_transactions WHERE transaction_id = ?
+"""
+
+SQL_SELECT_FRAUD_IDS_IN = """
+    SELECT transaction_id FROM fraud_transactions
+    WHERE transaction_id IN (SELECT value FROM json_each(?))
+"""
+
+SQL_FRAUD_TOTALS = """
+    SELECT COUNT(*) AS total,
+           COALESCE(SUM(verdict = 'SAFE'), 0) AS safe,
+           COALESCE(SUM(verdict = 'SUSPICIOUS'), 0) AS suspicious,
+           COALESCE(SUM(verdict = 'HIGH_RISK'), 0) AS high_risk,
+           AVG(processing_time_ms) AS avg_time
+    FROM fraud_transactions
+"""
+
+SQL_FRAUD_TYPE_COUNTS = """
+    SELECT fraud_type, COUNT(*) as cnt FROM fraud_transactions
+    WHERE fraud_type IS NOT NULL AND fraud_type != ''
+    GROUP BY fraud_type
+"""
+
+SQL_INSERT_CREDIT = """
+    INSERT INTO credit_assessments (
+        id, assessment_id, user_id, age, occupation, monthly_income,
+        final_score, risk_band, reason_codes, rule_score, ml_score,
+        ml_probability, processing_time_ms, applicant_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_SELECT_CREDIT = f"""
+    SELECT id, assessment_id, user_id, age, occupation, monthly_income,
+           final_score, risk_band, processing_time_ms, {CREATED_AT_ISO} AS created_at
+    FROM credit_assessments
+    ORDER BY credit_assessments.created_at DESC, credit_assessments.rowid DESC
+    LIMIT ?
+"""
+
+SQL_SELECT_CREDIT_BY_ID = """
+    SELECT * FROM credit_assessments WHERE assessment_id = ?
+"""
+
+SQL_SELECT_CREDIT_USER_IDS_IN = """
+    SELECT user_id FROM credit_assessments
+    WHERE user_id IN (SELECT value FROM json_each(?))
+"""
+
+SQL_CREDIT_TOTALS = """
+    SELECT COUNT(*) AS total,
+           COALESCE(SUM(risk_band = 'Low'), 0) AS low,
+           COALESCE(SUM(risk_band = 'Moderate'), 0) AS moderate,
+           COALESCE(SUM(risk_band = 'High'), 0) AS high,
+           AVG(final_score) AS avg_score,
+           AVG(processing_time_ms) AS avg_time
+    FROM credit_assessments
+"""
+
+SQL_SELECT_LEGACY_TABLES = """
+    SELECT m.name FROM sqlite_master m, pragma_table_info(m.name) c
+    WHERE m.type = 'table' AND c.name = 'created_at' AND c.type = 'TEXT'
+"""
+
+
+def _delete_oldest_sql(table: str, key: str) -> tuple[str, str, str]:
+    return (
+        f"""
+            DELETE FROM {table}
+            WHERE rowid = (SELECT rowid FROM {table} ORDER BY created_at ASC, rowid ASC LIMIT 1)
+            RETURNING {key}
+        """,
+        f"SELECT rowid, {key} FROM {table} ORDER BY created_at ASC, rowid ASC LIMIT 1",
+        f"DELETE FROM {table} WHERE rowid = ?",
+    )
+
+
+SQL_DELETE_OLDEST_FRAUD = _delete_oldest_sql("fraud_transactions", "transaction_id")
+SQL_DELETE_OLDEST_CREDIT = _delete_oldest_sql("credit_assessments", "user_id")
+
+
+def _iso_from_ms(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> list[dict]:
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    keys = tuple(column[0] for column in cursor.description)
+    return [dict(zip(keys, row)) for row in cursor]
+
+
+def _delete_oldest(statements: tuple[str, str, str], key: str) -> str | None:
+    delete_returning, select_oldest, delete_by_rowid = statements
+    with get_connection() as conn:
+        if HAS_RETURNING:
+            row = conn.execute(delete_returning).fetchone()
+            return row[key] if row else None
+        row = conn.execute(select_oldest).fetchone()
+        if row:
+            conn.execute(delete_by_rowid, (row["rowid"],))
+            return row[key]
+        return None
+
+
+def init_all():
+    with get_connection() as conn:
+        # Tables created before created_at became unix-ms INTEGER are rebuilt in place.
+        legacy_tables = [row["name"] for row in conn.execute(SQL_SELECT_LEGACY_TABLES)]
+        for table in legacy_tables:
+            conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        for ddl in ALL_DDL:
+            conn.execute(ddl)
+        for table in legacy_tables:
+            columns = ", ".join(
+                row["name"] for row in conn.execute(f"PRAGMA table_info({table}_legacy)")
+                if row["name"] != "created_at"
             )
-        """)
+            conn.execute(f"""
+                INSERT INTO {table} ({columns}, created_at)
+                SELECT {columns}, CAST(ROUND((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER)
+                FROM {table}_legacy
+                ORDER BY {table}_legacy.created_at, {table}_legacy.rowid
+            """)
+            conn.execute(f"DROP TABLE {table}_legacy")
+        for ddl in ALL_INDEXES:
+            conn.execute(ddl)
 
 
 def save_analysis(
@@ -54,70 +378,42 @@ def save_analysis(
     processing_time: float,
     report_json: str
 ):
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO analyses (
-                id, filename, regulation_title, regulation_reference,
-                overall_status, gaps_count, action_items_count,
-                processing_time, report_json, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            analysis_id,
-            filename,
-            regulation_title,
-            regulation_reference,
-            overall_status,
-            gaps_count,
-            action_items_count,
-            processing_time,
-            report_json,
-            datetime.utcnow().isoformat()
-        ))
+    save_analyses_bulk([(
+        analysis_id,
+        filename,
+        regulation_title,
+        regulation_reference,
+        overall_status,
+        gaps_count,
+        action_items_count,
+        processing_time,
+        report_json
+    )])
+
+
+def save_analyses_bulk(rows: list[tuple]):
+    """Rows follow the save_analysis argument order."""
+    with get_connection() as conn:
+        conn.executemany(SQL_INSERT_ANALYSIS, rows)
 
 
 def get_analyses(limit: int = 10):
-    with get_db() as conn:
-        rows = conn.execute("""
-            SELECT id, filename, regulation_title, regulation_reference,
-                   overall_status, gaps_count, action_items_count,
-                   processing_time, created_at
-            FROM analyses
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
-        return [dict(row) for row in rows]
+    with get_read_connection() as conn:
+        return _fetch_dicts(conn, SQL_SELECT_ANALYSES, (limit,))
 
 
 def get_analysis_by_id(analysis_id: str):
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT * FROM analyses WHERE id = ?
-        """, (analysis_id,)).fetchone()
+    with get_read_connection() as conn:
+        row = conn.execute(SQL_SELECT_ANALYSIS_BY_ID, (analysis_id,)).fetchone()
         if row:
             result = dict(row)
+            result["created_at"] = _iso_from_ms(result["created_at"])
             if result.get("report_json"):
-                result["report"] = json.loads(result["report_json"])
+                result["report"] = orjson.loads(result["report_json"])
             return result
         return None
 
 
-def init_investment_strategies_table():
-    with get_db() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS investment_strategies (
-                id TEXT PRIMARY KEY,
-                ticker_or_sector TEXT NOT NULL,
-                risk_tolerance TEXT NOT NULL,
-                investment_horizon TEXT NOT NULL,
-                focus_areas TEXT,
-                strategy_name TEXT,
-                strategy_json TEXT,
-                processing_time REAL,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-
 def save_investment_strategy(
     strategy_id: str,
     ticker_or_sector: str,
@@ -128,79 +424,39 @@ def save_investment_strategy(
     strategy_json: str,
     processing_time: float
 ):
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO investment_strategies (
-                id, ticker_or_sector, risk_tolerance, investment_horizon,
-                focus_areas, strategy_name, strategy_json, processing_time, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            strategy_id,
-            ticker_or_sector,
-            risk_tolerance,
-            investment_horizon,
-            focus_areas,
-            strategy_name,
-            strategy_json,
-            processing_time,
-            datetime.utcnow().isoformat()
-        ))
+    save_investment_strategies_bulk([(
+        strategy_id,
+        ticker_or_sector,
+        risk_tolerance,
+        investment_horizon,
+        focus_areas,
+        strategy_name,
+        strategy_json,
+        processing_time
+    )])
+
+
+def save_investment_strategies_bulk(rows: list[tuple]):
+    """Rows follow the save_investment_strategy argument order."""
+    with get_connection() as conn:
+        conn.executemany(SQL_INSERT_INVESTMENT_STRATEGY, rows)
 
 
 def get_investment_strategies(limit: int = 10):
-    with get_db() as conn:
-        rows = conn.execute("""
-            SELECT id, ticker_or_sector, strategy_name, risk_tolerance,
-                   investment_horizon, processing_time, created_at
-            FROM investment_strategies
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
-        return [dict(row) for row in rows]
+    with get_read_connection() as conn:
+        return _fetch_dicts(conn, SQL_SELECT_INVESTMENT_STRATEGIES, (limit,))
 
 
 def get_investment_strategy_by_id(strategy_id: str):
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT * FROM investment_strategies WHERE id = ?
-        """, (strategy_id,)).fetchone()
+    with get_read_connection() as conn:
+        row = conn.execute(SQL_SELECT_INVESTMENT_STRATEGY_BY_ID, (strategy_id,)).fetchone()
         if row:
             result = dict(row)
-            if result.get("strategy_json"):
-                result["strategy_output"] = json.loads(result["strategy_json"])
+            result["created_at"] = _iso_from_ms(result["created_at"])
             return result
         return None
 
 
-init_db()
-init_investment_strategies_table()
-
-
-def init_fraud_transactions_table():
-    with get_db() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS fraud_transactions (
-                id TEXT PRIMARY KEY,
-                transaction_id TEXT UNIQUE NOT NULL,
-                amount REAL NOT NULL,
-                type TEXT NOT NULL,
-                source_account_id TEXT,
-                destination_name TEXT,
-                risk_score INTEGER,
-                verdict TEXT,
-                fraud_type TEXT,
-                tier_reached INTEGER,
-                rule_flags TEXT,
-                ml_score REAL,
-                ml_features TEXT,
-                ai_reasoning TEXT,
-                processing_time_ms REAL,
-                transaction_json TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-
 def save_fraud_transaction(
     record_id: str,
     transaction_id: str,
@@ -219,138 +475,80 @@ def save_fraud_transaction(
     processing_time_ms: float,
     transaction_json: str
 ):
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO fraud_transactions (
-                id, transaction_id, amount, type, source_account_id,
-                destination_name, risk_score, verdict, fraud_type, tier_reached,
-                rule_flags, ml_score, ml_features, ai_reasoning,
-                processing_time_ms, transaction_json, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            record_id,
-            transaction_id,
-            amount,
-            txn_type,
-            source_account_id,
-            destination_name,
-            risk_score,
-            verdict,
-            fraud_type,
-            tier_reached,
-            rule_flags,
-            ml_score,
-            ml_features,
-            ai_reasoning,
-            processing_time_ms,
-            transaction_json,
-            datetime.utcnow().isoformat()
-        ))
+    save_fraud_transactions_bulk([(
+        record_id,
+        transaction_id,
+        amount,
+        txn_type,
+        source_account_id,
+        destination_name,
+        risk_score,
+        verdict,
+        fraud_type,
+        tier_reached,
+        rule_flags,
+        ml_score,
+        ml_features,
+        ai_reasoning,
+        processing_time_ms,
+        transaction_json
+    )])
+
+
+def save_fraud_transactions_bulk(rows: list[tuple]):
+    """Rows follow the save_fraud_transaction argument order."""
+    with get_connection() as conn:
+        conn.executemany(SQL_INSERT_FRAUD, rows)
 
 
 def get_fraud_transactions(limit: int = 50):
-    with get_db() as conn:
-        rows = conn.execute("""
-            SELECT id, transaction_id, amount, type, destination_name,
-                   risk_score, verdict, fraud_type, created_at
-            FROM fraud_transactions
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
-        return [dict(row) for row in rows]
+    with get_read_connection() as conn:
+        return _fetch_dicts(conn, SQL_SELECT_FRAUD, (limit,))
 
 
 def get_fraud_transaction_by_id(transaction_id: str):
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT * FROM fraud_transactions WHERE transaction_id = ?
-        """, (transaction_id,)).fetchone()
+    with get_read_connection() as conn:
+        row = conn.execute(SQL_SELECT_FRAUD_BY_ID, (transaction_id,)).fetchone()
         if row:
             result = dict(row)
+            result["created_at"] = _iso_from_ms(result["created_at"])
             if result.get("transaction_json"):
-                result["transaction_data"] = json.loads(result["transaction_json"])
+                result["transaction_data"] = orjson.loads(result["transaction_json"])
             if result.get("rule_flags"):
-                result["rule_flags_list"] = json.loads(result["rule_flags"])
+                result["rule_flags_list"] = orjson.loads(result["rule_flags"])
             if result.get("ml_features"):
-                result["ml_features_dict"] = json.loads(result["ml_features"])
+                result["ml_features_dict"] = orjson.loads(result["ml_features"])
             return result
         return None
 
 
-def get_processed_transaction_ids() -> set[str]:
-    with get_db() as conn:
-        rows = conn.execute("""
-            SELECT transaction_id FROM fraud_transactions
-        """).fetchall()
+def get_processed_transaction_ids_in(transaction_ids: list[str]) -> set[str]:
+    with get_read_connection() as conn:
+        rows = conn.execute(SQL_SELECT_FRAUD_IDS_IN, (orjson.dumps(transaction_ids).decode(),)).fetchall()
         return {row["transaction_id"] for row in rows}
 
 
 def delete_oldest_fraud_transaction() -> str | None:
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT transaction_id FROM fraud_transactions
-            ORDER BY created_at ASC LIMIT 1
-        """).fetchone()
-        if row:
-            txn_id = row["transaction_id"]
-            conn.execute("""
-                DELETE FROM fraud_transactions WHERE transaction_id = ?
-            """, (txn_id,))
-            return txn_id
-        return None
+    return _delete_oldest(SQL_DELETE_OLDEST_FRAUD, "transaction_id")
 
 
 def get_fraud_stats():
-    with get_db() as conn:
-        total = conn.execute("SELECT COUNT(*) as cnt FROM fraud_transactions").fetchone()["cnt"]
-        safe = conn.execute("SELECT COUNT(*) as cnt FROM fraud_transactions WHERE verdict = 'SAFE'").fetchone()["cnt"]
-        suspicious = conn.execute("SELECT COUNT(*) as cnt FROM fraud_transactions WHERE verdict = 'SUSPICIOUS'").fetchone()["cnt"]
-        high_risk = conn.execute("SELECT COUNT(*) as cnt FROM fraud_transactions WHERE verdict = 'HIGH_RISK'").fetchone()["cnt"]
-        avg_time = conn.execute("SELECT AVG(processing_time_ms) as avg FROM fraud_transactions").fetchone()["avg"] or 0
-
-        fraud_types = conn.execute("""
-            SELECT fraud_type, COUNT(*) as cnt FROM fraud_transactions
-            WHERE fraud_type IS NOT NULL AND fraud_type != ''
-            GROUP BY fraud_type
-        """).fetchall()
+    with get_read_connection() as conn:
+        totals = conn.execute(SQL_FRAUD_TOTALS).fetchone()
+
+        fraud_types = conn.execute(SQL_FRAUD_TYPE_COUNTS).fetchall()
         fraud_type_breakdown = {row["fraud_type"]: row["cnt"] for row in fraud_types}
 
         return {
-            "total_transactions": total,
-            "safe_count": safe,
-            "suspicious_count": suspicious,
-            "high_risk_count": high_risk,
-            "avg_processing_time_ms": round(avg_time, 2),
+            "total_transactions": totals["total"],
+            "safe_count": totals["safe"],
+            "suspicious_count": totals["suspicious"],
+            "high_risk_count": totals["high_risk"],
+            "avg_processing_time_ms": round(totals["avg_time"] or 0, 2),
             "fraud_type_breakdown": fraud_type_breakdown
         }
 
 
-init_fraud_transactions_table()
-
-
-def init_credit_assessments_table():
-    with get_db() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS credit_assessments (
-                id TEXT PRIMARY KEY,
-                assessment_id TEXT UNIQUE NOT NULL,
-                user_id TEXT NOT NULL,
-                age INTEGER,
-                occupation TEXT,
-                monthly_income REAL,
-                final_score INTEGER,
-                risk_band TEXT,
-                reason_codes TEXT,
-                rule_score INTEGER,
-                ml_score INTEGER,
-                ml_probability REAL,
-                processing_time_ms REAL,
-                applicant_json TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-
 def save_credit_assessment(
     record_id: str,
     assessment_id: str,
@@ -367,99 +565,69 @@ def save_credit_assessment(
     processing_time_ms: float,
     applicant_json: str
 ):
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO credit_assessments (
-                id, assessment_id, user_id, age, occupation, monthly_income,
-                final_score, risk_band, reason_codes, rule_score, ml_score,
-                ml_probability, processing_time_ms, applicant_json, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            record_id,
-            assessment_id,
-            user_id,
-            age,
-            occupation,
-            monthly_income,
-            final_score,
-            risk_band,
-            reason_codes,
-            rule_score,
-            ml_score,
-            ml_probability,
-            processing_time_ms,
-            applicant_json,
-            datetime.utcnow().isoformat()
-        ))
+    save_credit_assessments_bulk([(
+        record_id,
+        assessment_id,
+        user_id,
+        age,
+        occupation,
+        monthly_income,
+        final_score,
+        risk_band,
+        reason_codes,
+        rule_score,
+        ml_score,
+        ml_probability,
+        processing_time_ms,
+        applicant_json
+    )])
+
+
+def save_credit_assessments_bulk(rows: list[tuple]):
+    """Rows follow the save_credit_assessment argument order."""
+    with get_connection() as conn:
+        conn.executemany(SQL_INSERT_CREDIT, rows)
 
 
 def get_credit_assessments(limit: int = 50):
-    with get_db() as conn:
-        rows = conn.execute("""
-            SELECT id, assessment_id, user_id, age, occupation, monthly_income,
-                   final_score, risk_band, processing_time_ms, created_at
-            FROM credit_assessments
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
-        return [dict(row) for row in rows]
+    with get_read_connection() as conn:
+        return _fetch_dicts(conn, SQL_SELECT_CREDIT, (limit,))
 
 
 def get_credit_assessment_by_id(assessment_id: str):
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT * FROM credit_assessments WHERE assessment_id = ?
-        """, (assessment_id,)).fetchone()
+    with get_read_connection() as conn:
+        row = conn.execute(SQL_SELECT_CREDIT_BY_ID, (assessment_id,)).fetchone()
         if row:
             result = dict(row)
+            result["created_at"] = _iso_from_ms(result["created_at"])
             if result.get("applicant_json"):
-                result["applicant_data"] = json.loads(result["applicant_json"])
+                result["applicant_data"] = orjson.loads(result["applicant_json"])
             if result.get("reason_codes"):
-                result["reason_codes_list"] = json.loads(result["reason_codes"])
+                result["reason_codes_list"] = orjson.loads(result["reason_codes"])
             return result
         return None
 
 
-def get_processed_applicant_ids() -> set[str]:
-    with get_db() as conn:
-        rows = conn.execute("""
-            SELECT user_id FROM credit_assessments
-        """).fetchall()
+def get_processed_applicant_ids_in(user_ids: list[str]) -> set[str]:
+    with get_read_connection() as conn:
+        rows = conn.execute(SQL_SELECT_CREDIT_USER_IDS_IN, (orjson.dumps(user_ids).decode(),)).fetchall()
         return {row["user_id"] for row in rows}
 
 
 def delete_oldest_credit_assessment() -> str | None:
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT user_id FROM credit_assessments
-            ORDER BY created_at ASC LIMIT 1
-        """).fetchone()
-        if row:
-            user_id = row["user_id"]
-            conn.execute("""
-                DELETE FROM credit_assessments WHERE user_id = ?
-            """, (user_id,))
-            return user_id
-        return None
+    return _delete_oldest(SQL_DELETE_OLDEST_CREDIT, "user_id")
 
 
 def get_credit_stats():
-    with get_db() as conn:
-        total = conn.execute("SELECT COUNT(*) as cnt FROM credit_assessments").fetchone()["cnt"]
-        low = conn.execute("SELECT COUNT(*) as cnt FROM credit_assessments WHERE risk_band = 'Low'").fetchone()["cnt"]
-        moderate = conn.execute("SELECT COUNT(*) as cnt FROM credit_assessments WHERE risk_band = 'Moderate'").fetchone()["cnt"]
-        high = conn.execute("SELECT COUNT(*) as cnt FROM credit_assessments WHERE risk_band = 'High'").fetchone()["cnt"]
-        avg_score = conn.execute("SELECT AVG(final_score) as avg FROM credit_assessments").fetchone()["avg"] or 0
-        avg_time = conn.execute("SELECT AVG(processing_time_ms) as avg FROM credit_assessments").fetchone()["avg"] or 0
+    with get_read_connection() as conn:
+        totals = conn.execute(SQL_CREDIT_TOTALS).fetchone()
 
         return {
-            "total_assessments": total,
-            "low_risk_count": low,
-            "moderate_risk_count": moderate,
-            "high_risk_count": high,
-            "avg_score": round(avg_score, 1),
-            "avg_processing_time_ms": round(avg_time, 2)
+            "total_assessments": totals["total"],
+            "low_risk_count": totals["low"],
+            "moderate_risk_count": totals["moderate"],
+            "high_risk_count": totals["high"],
+            "avg_score": round(totals["avg_score"] or 0, 1),
+            "avg_processing_time_ms": round(totals["avg_time"] or 0, 2)
         }
 
-
-init_credit_assessments_table()
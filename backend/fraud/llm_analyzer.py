@@ -1,4 +1,5 @@
-import json
+import orjson
+from functools import lru_cache
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
@@ -39,6 +40,11 @@ Fraud types to consider:
 Be thorough and detailed in your reasoning."""
 
 
+_PROMPT_HEAD, _rest = FRAUD_ANALYSIS_PROMPT.split("{transaction_data}")
+_PROMPT_FLAGS, _rest = _rest.split("{rule_flags}")
+_PROMPT_SCORE, _PROMPT_TAIL = _rest.split("{ml_score}")
+del _rest
+
 client = genai.Client()
 
 
@@ -47,11 +53,25 @@ def analyze_transaction(
     rule_flags: list[str],
     ml_score: float
 ) -> AIAnalysisResult:
-    prompt = FRAUD_ANALYSIS_PROMPT.format(
-        transaction_data=json.dumps(txn_data, indent=2, default=str),
-        rule_flags=", ".join(rule_flags) if rule_flags else "None",
-        ml_score=ml_score
-    )
+    # Normalize the inputs so equivalent analyses share one cache entry
+    return AIAnalysisResult.model_validate_json(_generate_analysis(
+        orjson.dumps(txn_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=str).decode(),
+        tuple(sorted(rule_flags)),
+        round(ml_score, 2)
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _generate_analysis(txn_json: str, rule_flags: tuple[str, ...], ml_score: float) -> str:
+    prompt = "".join((
+        _PROMPT_HEAD,
+        txn_json,
+        _PROMPT_FLAGS,
+        ", ".join(rule_flags) if rule_flags else "None",
+        _PROMPT_SCORE,
+        str(ml_score),
+        _PROMPT_TAIL
+    ))
 
     response = client.models.generate_content(
         model="gemini-2.5-flash",
@@ -61,5 +81,4 @@ def analyze_transaction(
             response_schema=AIAnalysisResult
         )
     )
-
-    return AIAnalysisResult.model_validate_json(response.text)
+    return response.text
@@ -1,7 +1,8 @@
 import time
+import numpy as np
 from schemas.fraud import Transaction, RuleResult
 
-INDIAN_LOCATIONS = [
+INDIAN_LOCATIONS = frozenset({
     "Mumbai", "Delhi", "Bangalore", "Hyderabad", "Chennai", "Kolkata", "Pune",
     "Ahmedabad", "Jaipur", "Surat", "Lucknow", "Kanpur", "Nagpur", "Indore",
     "Thane", "Bhopal", "Visakhapatnam", "Pimpri-Chinchwad", "Patna", "Vadodara",
@@ -10,122 +11,176 @@ INDIAN_LOCATIONS = [
     "Allahabad", "Ranchi", "Howrah", "Coimbatore", "Jabalpur", "Gwalior",
     "Vijayawada", "Jodhpur", "Madurai", "Raipur", "Kota", "Gurgaon", "Noida",
     "Guwahati", "Chandigarh", "Kochi", "Tier-3 City", "India"
-]
+})
 
-HIGH_RISK_MCCS = [
+HIGH_RISK_MCCS = frozenset({
     "7995",  # Gambling
     "6211",  # Securities brokers/dealers
     "6010", "6011",  # Financial institutions - cash
     "4829",  # Money transfer
     "5967",  # Direct marketing - inbound teleservices merchant
     "5966",  # Direct marketing - outbound teleservices merchant
-]
-
-LOW_RISK_RELATIONSHIPS = ["landlord", "utility_provider", "family", "e_commerce", "merchant"]
-HIGH_RISK_RELATIONSHIPS = ["unknown", "business", "crypto_exchange"]
+})
+
+LOW_RISK_RELATIONSHIPS = frozenset({"landlord", "utility_provider", "family", "e_commerce", "merchant"})
+HIGH_RISK_RELATIONSHIPS = frozenset({"unknown", "business", "crypto_exchange"})
+
+# Minor flags alone do not warrant ML scoring
+MINOR_FLAGS = frozenset({"HIGH_VALUE", "HIGH_BALANCE_RATIO"})
+
+# Every flag apply_rules can raise, in the order it raises them
+RULE_NAMES = (
+    "VERY_HIGH_VALUE",
+    "HIGH_VALUE",
+    "NEAR_FULL_BALANCE_WITHDRAWAL",
+    "HIGH_BALANCE_RATIO",
+    "EXTREME_AMOUNT_DEVIATION",
+    "HIGH_AMOUNT_DEVIATION",
+    "STRUCTURING_AMOUNT",
+    "VERY_NEW_ACCOUNT",
+    "NEW_ACCOUNT",
+    "NEW_ACCOUNT_HIGH_VALUE",
+    "HIGH_VELOCITY",
+    "VERY_HIGH_AMOUNT_VELOCITY",
+    "HIGH_AMOUNT_VELOCITY",
+    "NEW_BENEFICIARY_HIGH_VALUE",
+    "UNKNOWN_RELATIONSHIP",
+    "HIGH_RISK_RELATIONSHIP",
+    "INTERNATIONAL_TRANSFER",
+    "INTERNATIONAL_UNKNOWN_BENEFICIARY",
+    "CROSS_BORDER_MISMATCH",
+    "GEO_LOCATION_HIDDEN",
+    "DEVICE_CHANGE",
+    "DEVICE_CHANGE_HIGH_VALUE",
+    "VERY_HIGH_IP_RISK",
+    "HIGH_IP_RISK",
+    "MODERATE_IP_RISK",
+    "RUSHED_HIGH_VALUE_TRANSACTION",
+    "MULTIPLE_FAILED_ATTEMPTS",
+    "LATE_NIGHT_TRANSACTION",
+    "EARLY_MORNING_TRANSACTION",
+    "VIDEO_KYC_HIGH_VALUE",
+    "INCOMPLETE_KYC",
+    "HIGH_VALUE_MOBILE",
+    "HIGH_RISK_MERCHANT_CATEGORY",
+    "SYNTHETIC_IDENTITY_PATTERN",
+    "STRUCTURING_PATTERN",
+)
+SIGNIFICANT_RULES = np.array([name not in MINOR_FLAGS for name in RULE_NAMES])
 
 
 def apply_rules(txn: Transaction) -> RuleResult:
     start_time = time.perf_counter()
     flags: list[str] = []
 
+    # Read each model field once; the rules below only touch locals
+    amount = txn.amount
+    source = txn.source_account
+    destination = txn.destination
+    signals = txn.risk_signals
+    account_age_days = source.account_age_days
+    is_known_beneficiary = destination.is_known_beneficiary
+    device_change = signals.device_change_flag
+    ip_risk_score = signals.ip_risk_score
+    dest_location = destination.location
+    high_value = amount > 100000
+    young_account = account_age_days < 30
+    high_ip_risk = ip_risk_score > 50
+    international = bool(dest_location) and dest_location not in INDIAN_LOCATIONS
+    structuring = 49000 <= amount <= 49999
+
     # === AMOUNT-BASED RULES ===
-    if txn.amount > 500000:
-        flags.append("VERY_HIGH_VALUE")
-    elif txn.amount > 100000:
-        flags.append("HIGH_VALUE")
+    if high_value:
+        flags.append("VERY_HIGH_VALUE" if amount > 500000 else "HIGH_VALUE")
 
     # Amount vs average balance ratio (spending more than typical balance)
-    balance_ratio = txn.amount / max(txn.source_account.avg_monthly_balance, 1)
+    balance_ratio = amount / max(source.avg_monthly_balance, 1)
     if balance_ratio > 0.8:
         flags.append("NEAR_FULL_BALANCE_WITHDRAWAL")
     elif balance_ratio > 0.5:
         flags.append("HIGH_BALANCE_RATIO")
 
     # Amount vs typical transaction pattern
-    avg_txn = txn.source_account.avg_transaction_amount
+    avg_txn = source.avg_transaction_amount
     if avg_txn > 0:
-        amount_deviation = txn.amount / avg_txn
+        amount_deviation = amount / avg_txn
         if amount_deviation > 10:
             flags.append("EXTREME_AMOUNT_DEVIATION")
         elif amount_deviation > 5:
             flags.append("HIGH_AMOUNT_DEVIATION")
 
     # Structuring detection (just below reporting thresholds)
-    if 49000 <= txn.amount <= 49999:
+    if structuring:
         flags.append("STRUCTURING_AMOUNT")
 
     # === ACCOUNT AGE RULES ===
-    if txn.source_account.account_age_days < 7:
-        flags.append("VERY_NEW_ACCOUNT")
-    elif txn.source_account.account_age_days < 30:
-        flags.append("NEW_ACCOUNT")
-
-    # New account + high value = suspicious
-    if txn.source_account.account_age_days < 30 and txn.amount > 100000:
-        flags.append("NEW_ACCOUNT_HIGH_VALUE")
+    if young_account:
+        flags.append("VERY_NEW_ACCOUNT" if account_age_days < 7 else "NEW_ACCOUNT")
+        # New account + high value = suspicious
+        if high_value:
+            flags.append("NEW_ACCOUNT_HIGH_VALUE")
 
     # === VELOCITY RULES ===
-    if txn.risk_signals.velocity_txn_last_10min > 3:
+    velocity_txn = signals.velocity_txn_last_10min
+    if velocity_txn > 3:
         flags.append("HIGH_VELOCITY")
-    
-    if txn.risk_signals.velocity_amt_last_1hr > 200000:
-        flags.append("VERY_HIGH_AMOUNT_VELOCITY")
-    elif txn.risk_signals.velocity_amt_last_1hr > 100000:
-        flags.append("HIGH_AMOUNT_VELOCITY")
+
+    velocity_amt = signals.velocity_amt_last_1hr
+    if velocity_amt > 100000:
+        flags.append("VERY_HIGH_AMOUNT_VELOCITY" if velocity_amt > 200000 else "HIGH_AMOUNT_VELOCITY")
 
     # Velocity relative to account history - only flag if VERY unusual
     # monthly_avg = txn.source_account.total_transactions_30d
     # Removed: This was flagging normal transactions too aggressively
 
     # === BENEFICIARY RULES ===
-    if not txn.destination.is_known_beneficiary:
-        if txn.amount > 100000:  # Raised threshold
+    if not is_known_beneficiary:
+        if high_value:  # Raised threshold
             flags.append("NEW_BENEFICIARY_HIGH_VALUE")
-        if txn.destination.relationship == "unknown":
+        relationship = destination.relationship
+        if relationship == "unknown":
             flags.append("UNKNOWN_RELATIONSHIP")
-    
-    # Only flag high risk relationships for UNKNOWN beneficiaries
-    if txn.destination.relationship in HIGH_RISK_RELATIONSHIPS and not txn.destination.is_known_beneficiary:
-        flags.append("HIGH_RISK_RELATIONSHIP")
+        # Only flag high risk relationships for UNKNOWN beneficiaries
+        if relationship in HIGH_RISK_RELATIONSHIPS:
+            flags.append("HIGH_RISK_RELATIONSHIP")
 
     # === LOCATION RULES ===
-    dest_location = txn.destination.location
-    if dest_location and dest_location not in INDIAN_LOCATIONS:
+    if international:
         flags.append("INTERNATIONAL_TRANSFER")
-        if not txn.destination.is_known_beneficiary:
+        if not is_known_beneficiary:
             flags.append("INTERNATIONAL_UNKNOWN_BENEFICIARY")
-
-    # Geo mismatch - account location vs source location
-    if txn.source_account.location != txn.destination.location:
-        if dest_location and dest_location not in INDIAN_LOCATIONS:
+        # Geo mismatch - account location vs destination location
+        if source.location != dest_location:
             flags.append("CROSS_BORDER_MISMATCH")
 
     # Geo coordinates missing (possible VPN/proxy)
-    if txn.risk_signals.geo_lat is None or txn.risk_signals.geo_long is None:
+    lat_missing = signals.geo_lat is None
+    if lat_missing or signals.geo_long is None:
         flags.append("GEO_LOCATION_HIDDEN")
 
     # === DEVICE AND IP RULES ===
-    if txn.risk_signals.device_change_flag:
+    if device_change:
         flags.append("DEVICE_CHANGE")
-        if txn.amount > 100000:
+        if high_value:
             flags.append("DEVICE_CHANGE_HIGH_VALUE")
 
-    if txn.risk_signals.ip_risk_score > 80:
-        flags.append("VERY_HIGH_IP_RISK")
-    elif txn.risk_signals.ip_risk_score > 50:
-        flags.append("HIGH_IP_RISK")
-    elif txn.risk_signals.ip_risk_score > 30:
-        flags.append("MODERATE_IP_RISK")
+    if ip_risk_score > 30:
+        if ip_risk_score > 80:
+            flags.append("VERY_HIGH_IP_RISK")
+        elif high_ip_risk:
+            flags.append("HIGH_IP_RISK")
+        else:
+            flags.append("MODERATE_IP_RISK")
 
     # === SESSION BEHAVIOR RULES ===
     # Only flag very short sessions for HIGH VALUE transactions
-    if txn.risk_signals.session_duration_seconds < 15 and txn.amount > 100000:
+    session_seconds = signals.session_duration_seconds
+    if high_value and session_seconds < 15:
         flags.append("RUSHED_HIGH_VALUE_TRANSACTION")
     # Removed SHORT_SESSION rule - too aggressive for normal transactions
 
     # === FAILED TRANSACTION HISTORY ===
-    if txn.risk_signals.failed_txn_count_24hr >= 3:  # Raised threshold
+    if signals.failed_txn_count_24hr >= 3:  # Raised threshold
         flags.append("MULTIPLE_FAILED_ATTEMPTS")
 
     # === TIME-BASED RULES ===
@@ -137,59 +192,139 @@ def apply_rules(txn: Transaction) -> RuleResult:
             flags.append("EARLY_MORNING_TRANSACTION")
 
     # === KYC STATUS RULES ===
-    if txn.source_account.kyc_status != "verified":
-        if txn.source_account.kyc_status == "video_kyc":
-            if txn.amount > 200000:
+    kyc_status = source.kyc_status
+    if kyc_status != "verified":
+        if kyc_status == "video_kyc":
+            if amount > 200000:
                 flags.append("VIDEO_KYC_HIGH_VALUE")
         else:
             flags.append("INCOMPLETE_KYC")
 
     # === CHANNEL-BASED RULES ===
     # High value via mobile for accounts that typically use net banking
-    if txn.channel == "mobile_app" and txn.amount > 200000:
+    if amount > 200000 and txn.channel == "mobile_app":
         flags.append("HIGH_VALUE_MOBILE")
 
     # === MERCHANT CATEGORY RULES ===
-    mcc = txn.destination.merchant_category_code
+    mcc = destination.merchant_category_code
     if mcc and mcc in HIGH_RISK_MCCS:
         flags.append("HIGH_RISK_MERCHANT_CATEGORY")
 
     # === COMPOSITE PATTERN DETECTION ===
     # Synthetic identity pattern: new account + device change + high IP risk + international
-    synthetic_signals = 0
-    if txn.source_account.account_age_days < 30:
-        synthetic_signals += 1
-    if txn.risk_signals.device_change_flag:
-        synthetic_signals += 1
-    if txn.risk_signals.ip_risk_score > 50:
-        synthetic_signals += 1
-    if dest_location and dest_location not in INDIAN_LOCATIONS:
-        synthetic_signals += 1
-    if txn.risk_signals.geo_lat is None:
-        synthetic_signals += 1
+    synthetic_signals = young_account + device_change + high_ip_risk + international + lat_missing
     if synthetic_signals >= 3:
         flags.append("SYNTHETIC_IDENTITY_PATTERN")
 
     # Money laundering pattern: structuring amount + velocity + multiple beneficiaries
-    if (49000 <= txn.amount <= 49999 and 
-        txn.risk_signals.velocity_txn_last_10min > 2 and
-        txn.risk_signals.session_duration_seconds < 30):
+    if structuring and velocity_txn > 2 and session_seconds < 30:
         flags.append("STRUCTURING_PATTERN")
 
     elapsed_ms = (time.perf_counter() - start_time) * 1000
 
     # Only pass to ML if there are SIGNIFICANT flags (not just minor ones)
-    minor_flags = {"HIGH_VALUE", "HIGH_BALANCE_RATIO"}
-    significant_flags = [f for f in flags if f not in minor_flags]
-    
-    return RuleResult(
+    return RuleResult.model_construct(
         flags=flags,
-        pass_to_ml=len(significant_flags) > 0,
+        pass_to_ml=not MINOR_FLAGS.issuperset(flags),
         processing_time_ms=elapsed_ms
     )
 
 
+def apply_rules_batch(txns: list[Transaction]) -> list[RuleResult]:
+    if not txns:
+        return []
+
+    start_time = time.perf_counter()
+
+    amount = np.array([t.amount for t in txns], dtype=np.float64)
+    avg_balance = np.array([t.source_account.avg_monthly_balance for t in txns], dtype=np.float64)
+    avg_txn = np.array([t.source_account.avg_transaction_amount for t in txns], dtype=np.float64)
+    age_days = np.array([t.source_account.account_age_days for t in txns], dtype=np.int64)
+    kyc_status = np.array([t.source_account.kyc_status for t in txns])
+    source_location = np.array([t.source_account.location for t in txns])
+    dest_location = np.array([t.destination.location for t in txns])
+    known_beneficiary = np.array([t.destination.is_known_beneficiary for t in txns], dtype=bool)
+    relationship = np.array([t.destination.relationship for t in txns])
+    mcc = np.array([t.destination.merchant_category_code or "" for t in txns])
+    velocity = np.array([t.risk_signals.velocity_txn_last_10min for t in txns], dtype=np.int64)
+    amount_velocity = np.array([t.risk_signals.velocity_amt_last_1hr for t in txns], dtype=np.float64)
+    ip_score = np.array([t.risk_signals.ip_risk_score for t in txns], dtype=np.int64)
+    device_change = np.array([t.risk_signals.device_change_flag for t in txns], dtype=bool)
+    session = np.array([t.risk_signals.session_duration_seconds for t in txns], dtype=np.int64)
+    failed = np.array([t.risk_signals.failed_txn_count_24hr for t in txns], dtype=np.int64)
+    lat_missing = np.array([t.risk_signals.geo_lat is None for t in txns], dtype=bool)
+    long_missing = np.array([t.risk_signals.geo_long is None for t in txns], dtype=bool)
+    mobile = np.array([t.channel == "mobile_app" for t in txns], dtype=bool)
+    hour = _extract_hours([t.timestamp for t in txns])
+
+    high_value = amount > 100000
+    balance_ratio = amount / np.maximum(avg_balance, 1)
+    amount_deviation = np.divide(amount, avg_txn, out=np.zeros_like(amount), where=avg_txn > 0)
+    structuring = (amount >= 49000) & (amount <= 49999)
+    young_account = age_days < 30
+    unknown_beneficiary = ~known_beneficiary
+    international = (dest_location != "") & ~np.isin(dest_location, tuple(INDIAN_LOCATIONS))
+    synthetic_signals = (
+        young_account.astype(np.int64) + device_change + (ip_score > 50) + international + lat_missing
+    )
+
+    flags_mat = np.column_stack([
+        amount > 500000,
+        high_value & (amount <= 500000),
+        balance_ratio > 0.8,
+        (balance_ratio > 0.5) & (balance_ratio <= 0.8),
+        amount_deviation > 10,
+        (amount_deviation > 5) & (amount_deviation <= 10),
+        structuring,
+        age_days < 7,
+        (age_days >= 7) & young_account,
+        young_account & high_value,
+        velocity > 3,
+        amount_velocity > 200000,
+        (amount_velocity > 100000) & (amount_velocity <= 200000),
+        unknown_beneficiary & high_value,
+        unknown_beneficiary & (relationship == "unknown"),
+        unknown_beneficiary & np.isin(relationship, tuple(HIGH_RISK_RELATIONSHIPS)),
+        international,
+        international & unknown_beneficiary,
+        international & (source_location != dest_location),
+        lat_missing | long_missing,
+        device_change,
+        device_change & high_value,
+        ip_score > 80,
+        (ip_score > 50) & (ip_score <= 80),
+        (ip_score > 30) & (ip_score <= 50),
+        (session < 15) & high_value,
+        failed >= 3,
+        (hour >= 0) & (hour < 5),
+        hour == 5,
+        (kyc_status == "video_kyc") & (amount > 200000),
+        (kyc_status != "verified") & (kyc_status != "video_kyc"),
+        mobile & (amount > 200000),
+        np.isin(mcc, tuple(HIGH_RISK_MCCS)),
+        synthetic_signals >= 3,
+        structuring & (velocity > 2) & (session < 30),
+    ])
+    pass_to_ml = flags_mat[:, SIGNIFICANT_RULES].any(axis=1).tolist()
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000 / len(txns)
+
+    return [
+        RuleResult.model_construct(
+            flags=[RULE_NAMES[i] for i in np.flatnonzero(row)],
+            pass_to_ml=to_ml,
+            processing_time_ms=elapsed_ms
+        )
+        for row, to_ml in zip(flags_mat, pass_to_ml)
+    ]
+
+
 def _extract_hour(timestamp: str) -> int | None:
+    # Fast path: ISO-8601 "YYYY-MM-DDTHH:..." has the hour at fixed offsets 11-12
+    if len(timestamp) >= 13 and timestamp[10] == "T" and timestamp[13:14] in (":", ""):
+        tens, units = timestamp[11], timestamp[12]
+        if "0" <= tens <= "9" and "0" <= units <= "9":
+            return (ord(tens) - 48) * 10 + ord(units) - 48
     try:
         if "T" in timestamp:
             time_part = timestamp.split("T")[1]
@@ -199,3 +334,22 @@ def _extract_hour(timestamp: str) -> int | None:
         pass
     return None
 
+
+def _extract_hours(timestamps: list[str]) -> np.ndarray:
+    # Vectorized _extract_hour over a fixed-width unicode array viewed as uint32
+    # code points; unparseable timestamps map to -1
+    chars = np.array(timestamps, dtype="U14").view(np.uint32).reshape(len(timestamps), 14)
+    tens = chars[:, 11].astype(np.int64) - 48
+    units = chars[:, 12].astype(np.int64) - 48
+    fast = (
+        (chars[:, 10] == ord("T"))
+        & (tens >= 0) & (tens <= 9)
+        & (units >= 0) & (units <= 9)
+        & ((chars[:, 13] == ord(":")) | (chars[:, 13] == 0))
+    )
+    hours = np.where(fast, tens * 10 + units, -1)
+    for i in np.flatnonzero(~fast):
+        hour = _extract_hour(timestamps[i])
+        if hour is not None:
+            hours[i] = hour
+    return hours
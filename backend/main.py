@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -12,11 +13,21 @@ from routers import policies
 from routers import invest
 from routers import fraud
 from routers import credit
+from database import init_all, run_maintenance
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_all()
+    yield
+    run_maintenance()
+
 
 app = FastAPI(
     title="FinGuard AI",
     description="AI-powered banking compliance and financial services platform",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS configuration for frontend
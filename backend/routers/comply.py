@@ -1,11 +1,17 @@
+import asyncio
+import os
 import time
+import shutil
 import tempfile
-import json
 import uuid
+import orjson
+from contextlib import aclosing
+from functools import lru_cache
 import logging
 from pathlib import Path
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.adk.events import Event, EventActions
@@ -17,6 +23,7 @@ from agents.comply.aggregator_agent import aggregator_agent
 from agents.comply.retriever_agent import get_policies_for_categories
 from schemas.comply import AnalyzeResponse, ComplianceReport
 from database import save_analysis, get_analyses, get_analysis_by_id
+from routers.streaming import with_keepalive
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -26,6 +33,35 @@ router = APIRouter(prefix="/api/v1/comply", tags=["Compliance"])
 # Initialize ADK session service
 session_service = InMemorySessionService()
 
+# Upper bound on policy analyzers calling Gemini at once for a single upload
+MAX_CONCURRENT_ANALYZERS = 4
+
+# Runners are session-agnostic, so one per agent serves every request
+pipeline_runner = Runner(agent=root_agent, app_name="finguard", session_service=session_service)
+aggregator_runner = Runner(agent=aggregator_agent, app_name="finguard", session_service=session_service)
+
+
+@lru_cache(maxsize=128)
+def _analyzer_runner(policy_name: str) -> Runner:
+    return Runner(
+        agent=create_policy_analyzer(policy_name),
+        app_name="finguard",
+        session_service=session_service
+    )
+
+
+def _read_from_start(upload) -> bytes:
+    upload.seek(0)
+    return upload.read()
+
+
+async def _drain(events) -> dict:
+    """Consume an agent run, returning the state changes it made."""
+    state_delta = {}
+    async for event in events:
+        state_delta.update(event.actions.state_delta)
+    return state_delta
+
 
 @router.post("/analyze-stream")
 async def analyze_regulation_stream(file: UploadFile = File(...)):
@@ -33,80 +69,65 @@ async def analyze_regulation_stream(file: UploadFile = File(...)):
     Streaming version of analyze endpoint.
     Returns Server-Sent Events with progress updates during analysis.
     """
-    if not file.filename.endswith('.pdf'):
+    if os.path.splitext(file.filename or "")[1].lower() != ".pdf":
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
-    # Read file content upfront (can't do async in generator)
-    content = await file.read()
+    # Stream the upload to disk before the response starts, off the event loop.
+    # TemporaryFile is anonymous (O_TMPFILE on Linux) and vanishes when closed.
+    upload = tempfile.TemporaryFile()
+    try:
+        await asyncio.to_thread(shutil.copyfileobj, file.file, upload, 1 << 16)
+    except BaseException:
+        upload.close()
+        raise
     filename = file.filename
     
     async def event_generator():
-        start_time = time.time()
-        tmp_path = None
+        start_time = time.perf_counter()
         
         def emit(event_type: str, **data):
             """Helper to format SSE events as NDJSON"""
-            return json.dumps({"type": event_type, **data}) + "\n"
+            return orjson.dumps({"type": event_type, **data}) + b"\n"
         
+        session = None
         try:
-            # Save temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                tmp.write(content)
-                tmp_path = tmp.name
-            
             yield emit("progress", step="upload", message="Document uploaded successfully")
             
-            # Create session
-            session = await session_service.create_session(
-                app_name="finguard",
-                user_id="compliance_user"
+            # Create the session while the uploaded PDF is read off the event loop
+            session, pdf_content = await asyncio.gather(
+                session_service.create_session(
+                    app_name="finguard",
+                    user_id="compliance_user"
+                ),
+                asyncio.to_thread(_read_from_start, upload)
             )
             
             # STEP 1: Run Router + Retriever
             yield emit("progress", step="categorizing", message="Reading and categorizing regulation...")
             
-            pipeline_runner = Runner(
-                agent=root_agent,
-                app_name="finguard",
-                session_service=session_service
-            )
-            
-            with open(tmp_path, "rb") as f:
-                pdf_content = f.read()
-            
+            regulation_part = types.Part.from_bytes(data=pdf_content, mime_type="application/pdf")
             input_content = types.Content(
                 parts=[
-                    types.Part.from_bytes(data=pdf_content, mime_type="application/pdf"),
+                    regulation_part,
                     types.Part(text=f"Analyze this regulation document (filename: {filename}) for compliance with HDFC Bank policies.")
                 ]
             )
             
-            async for event in pipeline_runner.run_async(
+            pipeline_state = await _drain(pipeline_runner.run_async(
                 user_id="compliance_user",
                 session_id=session.id,
                 new_message=input_content
-            ):
-                # Emit agent events for transparency
-                if event.author and event.author != "user":
-                    if hasattr(event, 'content') and event.content:
-                        pass  # Agent is processing
+            ))
             
             yield emit("progress", step="categorized", message="Regulation categories identified")
             
-            # Get categories from session
-            current_session = await session_service.get_session(
-                app_name="finguard",
-                user_id="compliance_user",
-                session_id=session.id
-            )
-            
-            categories_data = current_session.state.get('categories_result')
+            categories_data = pipeline_state.get('categories_result')
             if not categories_data:
                 yield emit("error", message="Could not categorize the regulation document")
                 return
             
             if isinstance(categories_data, str):
-                categories_info = json.loads(categories_data)
+                categories_info = orjson.loads(categories_data)
             else:
                 categories_info = categories_data
             
@@ -134,68 +155,61 @@ async def analyze_regulation_stream(file: UploadFile = File(...)):
                 "total_policies": len(policies_found)
             }
             
-            current_session = await session_service.get_session(
-                app_name="finguard",
-                user_id="compliance_user",
-                session_id=session.id
-            )
             state_update_event = Event(
                 invocation_id=session.id,
                 author="system",
                 actions=EventActions(state_delta={"policies_result": policies_result_data})
             )
-            await session_service.append_event(session=current_session, event=state_update_event)
+            await session_service.append_event(session=session, event=state_update_event)
             
-            # STEP 3: Analyze each policy
-            analysis_keys = []
+            # STEP 3: Analyze policies concurrently, reporting each one as it starts
+            analysis_keys = [_analyzer_runner(policy['file_name']).agent.output_key for policy in policies_found]
             total_policies = len(policies_found)
+            progress: asyncio.Queue[bytes | None] = asyncio.Queue()
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYZERS)
             
-            for idx, policy in enumerate(policies_found, 1):
+            async def analyze_policy(idx: int, policy: dict):
                 policy_name = policy['file_name']
-                policy_path = policy['file_path']
-                
-                yield emit("progress", step="analyzing", message=f"Analyzing {policy_name}...", current=idx, total=total_policies)
-                
-                with open(policy_path, "rb") as f:
-                    bank_policy_content = f.read()
-                
-                analyzer = create_policy_analyzer(policy_name)
-                analysis_keys.append(analyzer.output_key)
-                
-                analyzer_runner = Runner(
-                    agent=analyzer,
-                    app_name="finguard",
-                    session_service=session_service
-                )
-                
-                analyzer_input = types.Content(
-                    parts=[
-                        types.Part.from_bytes(data=pdf_content, mime_type="application/pdf"),
-                        types.Part.from_bytes(data=bank_policy_content, mime_type="application/pdf"),
-                        types.Part(text=f"""Compare these two documents:
+                async with semaphore:
+                    progress.put_nowait(emit("progress", step="analyzing", message=f"Analyzing {policy_name}...", current=idx, total=total_policies))
+                    
+                    bank_policy_content = await asyncio.to_thread(Path(policy['file_path']).read_bytes)
+                    
+                    analyzer_input = types.Content(
+                        parts=[
+                            regulation_part,
+                            types.Part.from_bytes(data=bank_policy_content, mime_type="application/pdf"),
+                            types.Part(text=f"""Compare these two documents:
 1. FIRST PDF: RBI Regulation - {filename}
 2. SECOND PDF: Bank Policy - {policy_name}
 
 Analyze the bank policy against the RBI regulation requirements and identify gaps, compliant items, and action items.""")
-                    ]
-                )
-                
-                async for event in analyzer_runner.run_async(
-                    user_id="compliance_user",
-                    session_id=session.id,
-                    new_message=analyzer_input
-                ):
-                    pass
+                        ]
+                    )
+                    
+                    await _drain(_analyzer_runner(policy_name).run_async(
+                        user_id="compliance_user",
+                        session_id=session.id,
+                        new_message=analyzer_input
+                    ))
+            
+            async def analyze_all():
+                try:
+                    await asyncio.gather(*(analyze_policy(idx, policy) for idx, policy in enumerate(policies_found, 1)))
+                finally:
+                    progress.put_nowait(None)
+            
+            analyses = asyncio.create_task(analyze_all())
+            try:
+                while (message := await progress.get()) is not None:
+                    yield message
+                await analyses
+            finally:
+                analyses.cancel()
             
             # STEP 4: Aggregate results
             yield emit("progress", step="aggregating", message="Generating compliance report...")
             
-            aggregator_runner = Runner(
-                agent=aggregator_agent,
-                app_name="finguard",
-                session_service=session_service
-            )
-            
             analysis_keys_str = ", ".join(analysis_keys)
             aggregator_input = types.Content(
                 parts=[types.Part(text=f"""Aggregate the analysis results from the session state.
@@ -208,29 +222,29 @@ The following session state keys contain the data you need:
 Read each analysis key and combine all gaps, compliant items, and action items into a single comprehensive compliance report.""")]
             )
             
-            async for event in aggregator_runner.run_async(
+            # Stop as soon as the report lands in the state delta
+            result = None
+            async with aclosing(aggregator_runner.run_async(
                 user_id="compliance_user",
                 session_id=session.id,
                 new_message=aggregator_input
-            ):
-                pass
-            
-            # Get final result
-            final_session = await session_service.get_session(
-                app_name="finguard",
-                user_id="compliance_user",
-                session_id=session.id
-            )
-            result = final_session.state.get('compliance_report')
+            )) as events:
+                async for event in events:
+                    result = event.actions.state_delta.get('compliance_report')
+                    if result:
+                        break
             
             if result:
+                if isinstance(result, str):
+                    result = orjson.loads(result)
                 report = ComplianceReport.model_validate(result)
-                processing_time = time.time() - start_time
+                processing_time = time.perf_counter() - start_time
                 
                 # Save to database
                 analysis_id = str(uuid.uuid4())
-                report_json_str = json.dumps(result) if isinstance(result, dict) else result
-                save_analysis(
+                report_json = orjson.dumps(result)
+                await asyncio.to_thread(
+                    save_analysis,
                     analysis_id=analysis_id,
                     filename=filename,
                     regulation_title=report.regulation_info.title,
@@ -239,11 +253,11 @@ Read each analysis key and combine all gaps, compliant items, and action items i
                     gaps_count=len(report.gaps),
                     action_items_count=len(report.action_items),
                     processing_time=processing_time,
-                    report_json=report_json_str
+                    report_json=report_json.decode()
                 )
                 
                 # Emit final result
-                yield emit("complete", report=result, processing_time_seconds=processing_time)
+                yield emit("complete", report=orjson.Fragment(report_json), processing_time_seconds=processing_time)
             else:
                 yield emit("error", message="No compliance report generated")
                 
@@ -251,18 +265,31 @@ Read each analysis key and combine all gaps, compliant items, and action items i
             logger.error(f"[STREAM ERROR] {e}", exc_info=True)
             yield emit("error", message=str(e))
         finally:
-            if tmp_path:
-                Path(tmp_path).unlink(missing_ok=True)
+            upload.close()
+            # Sessions carry the uploaded PDF in their event log; drop them once the stream ends
+            if session:
+                await session_service.delete_session(
+                    app_name="finguard",
+                    user_id="compliance_user",
+                    session_id=session.id
+                )
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
-    )
+    # The generator closes the upload when it runs; the background task covers a stream
+    # that is never iterated
+    try:
+        return StreamingResponse(
+            with_keepalive(event_generator()),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no"
+            },
+            background=BackgroundTask(upload.close)
+        )
+    except BaseException:
+        upload.close()
+        raise
 
 
 @router.get("/categories")
@@ -1,9 +1,11 @@
-import json
+import asyncio
 import time
 import uuid
+import orjson
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from schemas.credit import (
     CreditApplicant,
@@ -18,10 +20,10 @@ from credit.ml_model import ml_score, MODEL_AUC
 from credit.feature_mapper import to_ml_features
 from credit.reason_codes import generate_reason_codes
 from database import (
-    save_credit_assessment,
+    save_credit_assessments_bulk,
     get_credit_assessments,
     get_credit_assessment_by_id,
-    get_processed_applicant_ids,
+    get_processed_applicant_ids_in,
     delete_oldest_credit_assessment,
     get_credit_stats
 )
@@ -31,18 +33,35 @@ router = APIRouter(prefix="/api/v1/credit", tags=["Credit Scoring"])
 
 DATA_FILE = Path(__file__).parent.parent / "data" / "credit_sample_data.json"
 
+# Upper bound on applicants handled by one /process-batch call
+MAX_BATCH_SIZE = 50
 
-def load_sample_applicants() -> list[dict]:
+# Serializes pick -> save so concurrent requests never pick the same record
+_process_next_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_applicants(mtime_ns: int) -> dict[str, tuple[dict, CreditApplicant]]:
+    applicants_by_id = {}
+    for applicant in orjson.loads(DATA_FILE.read_bytes()):
+        user_id = applicant.get("user_id")
+        if user_id not in applicants_by_id:
+            applicants_by_id[user_id] = (applicant, CreditApplicant.model_validate(applicant))
+    return applicants_by_id
+
+
+def load_sample_applicants_by_id() -> dict[str, tuple[dict, CreditApplicant]]:
+    # Keyed on the file mtime so edits to the sample data are picked up (and validated once) without a restart
     if DATA_FILE.exists():
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+        return _load_applicants(DATA_FILE.stat().st_mtime_ns)
+    return {}
 
 
-def process_applicant(applicant_data: dict) -> CreditAssessmentResult:
+def process_applicant(applicant_data: dict, applicant: CreditApplicant | None = None) -> CreditAssessmentResult:
     start_time = time.perf_counter()
     
-    applicant = CreditApplicant.model_validate(applicant_data)
+    if applicant is None:
+        applicant = CreditApplicant.model_validate(applicant_data)
     
     r_score = rule_score(applicant)
     features = to_ml_features(applicant)
@@ -60,21 +79,23 @@ def process_applicant(applicant_data: dict) -> CreditAssessmentResult:
     reason_codes = generate_reason_codes(applicant)
     
     total_time_ms = (time.perf_counter() - start_time) * 1000
+    now = datetime.now()
     
-    return CreditAssessmentResult(
-        assessment_id=f"CR-{applicant.user_id}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-        timestamp=datetime.now().isoformat(),
+    # Every field comes from the validated applicant or scorer output, so skip re-validation
+    return CreditAssessmentResult.model_construct(
+        assessment_id=f"CR-{applicant.user_id}-{now:%Y%m%d%H%M%S}",
+        timestamp=now.isoformat(),
         applicant=applicant,
-        rule_scoring=RuleScoring(
+        rule_scoring=RuleScoring.model_construct(
             base_score=r_score,
             final_rule_score=r_score
         ),
-        ml_scoring=MLScoring(
+        ml_scoring=MLScoring.model_construct(
             high_risk_probability=round(prob, 4),
             ml_score=m_score,
             model_auc=round(MODEL_AUC, 3) if MODEL_AUC else None
         ),
-        decision=CreditDecision(
+        decision=CreditDecision.model_construct(
             final_credit_score=final_score,
             risk_band=band,
             reason_codes=reason_codes
@@ -83,59 +104,83 @@ def process_applicant(applicant_data: dict) -> CreditAssessmentResult:
     )
 
 
+def _assessment_row(result: CreditAssessmentResult, applicant_data: dict) -> tuple:
+    """Row for save_credit_assessments_bulk, in save_credit_assessment argument order."""
+    return (
+        str(uuid.uuid4()),
+        result.assessment_id,
+        result.applicant.user_id,
+        result.applicant.age,
+        result.applicant.occupation,
+        result.applicant.monthly_income,
+        result.decision.final_credit_score,
+        result.decision.risk_band.value,
+        orjson.dumps(result.decision.reason_codes).decode(),
+        result.rule_scoring.final_rule_score,
+        result.ml_scoring.ml_score,
+        result.ml_scoring.high_risk_probability,
+        result.processing_time_ms,
+        orjson.dumps(applicant_data).decode()
+    )
+
+
 @router.post("/process-next")
 async def process_next_applicant():
-    all_applicants = load_sample_applicants()
-    if not all_applicants:
-        raise HTTPException(status_code=404, detail="No sample applicants found")
+    async with _process_next_lock:
+        applicants_by_id = load_sample_applicants_by_id()
+        if not applicants_by_id:
+            raise HTTPException(status_code=404, detail="No sample applicants found")
     
-    processed_ids = get_processed_applicant_ids()
+        processed_ids = await asyncio.to_thread(get_processed_applicant_ids_in, list(applicants_by_id))
+        next_entry = next(
+            (entry for user_id, entry in applicants_by_id.items() if user_id not in processed_ids),
+            None
+        )
     
-    next_applicant = None
-    for applicant in all_applicants:
-        if applicant.get("user_id") not in processed_ids:
-            next_applicant = applicant
-            break
+        if next_entry is None:
+            next_entry = applicants_by_id.get(await asyncio.to_thread(delete_oldest_credit_assessment))
+            if next_entry is None:
+                next_entry = next(iter(applicants_by_id.values()))
+                await asyncio.to_thread(delete_oldest_credit_assessment)
     
-    if next_applicant is None:
-        deleted_id = delete_oldest_credit_assessment()
-        if deleted_id:
-            for applicant in all_applicants:
-                if applicant.get("user_id") == deleted_id:
-                    next_applicant = applicant
-                    break
-        
-        if next_applicant is None and all_applicants:
-            next_applicant = all_applicants[0]
-            delete_oldest_credit_assessment()
+        next_applicant, applicant = next_entry
+        result = process_applicant(next_applicant, applicant)
     
-    if next_applicant is None:
-        raise HTTPException(status_code=404, detail="No applicants available")
+        await asyncio.to_thread(save_credit_assessments_bulk, [_assessment_row(result, next_applicant)])
     
-    result = process_applicant(next_applicant)
-    
-    record_id = str(uuid.uuid4())
-    save_credit_assessment(
-        record_id=record_id,
-        assessment_id=result.assessment_id,
-        user_id=result.applicant.user_id,
-        age=result.applicant.age,
-        occupation=result.applicant.occupation,
-        monthly_income=result.applicant.monthly_income,
-        final_score=result.decision.final_credit_score,
-        risk_band=result.decision.risk_band.value,
-        reason_codes=json.dumps(result.decision.reason_codes),
-        rule_score=result.rule_scoring.final_rule_score,
-        ml_score=result.ml_scoring.ml_score,
-        ml_probability=result.ml_scoring.high_risk_probability,
-        processing_time_ms=result.processing_time_ms,
-        applicant_json=json.dumps(next_applicant)
+    return Response(
+        orjson.dumps({"success": True, "assessment": orjson.Fragment(result.model_dump_json())}),
+        media_type="application/json"
     )
+
+
+@router.post("/process-batch")
+async def process_applicant_batch(n: int = Query(10, ge=1, le=MAX_BATCH_SIZE)):
+    """Process up to n unprocessed sample applicants in one call, saving them in a single insert."""
+    async with _process_next_lock:
+        applicants_by_id = load_sample_applicants_by_id()
+        if not applicants_by_id:
+            raise HTTPException(status_code=404, detail="No sample applicants found")
     
-    return {
-        "success": True,
-        "assessment": result.model_dump()
-    }
+        processed_ids = await asyncio.to_thread(get_processed_applicant_ids_in, list(applicants_by_id))
+        batch = [entry for user_id, entry in applicants_by_id.items() if user_id not in processed_ids][:n]
+    
+        results = await asyncio.to_thread(
+            lambda: [process_applicant(applicant_data, applicant) for applicant_data, applicant in batch]
+        )
+        if results:
+            await asyncio.to_thread(save_credit_assessments_bulk, [
+                _assessment_row(result, applicant_data) for result, (applicant_data, _) in zip(results, batch)
+            ])
+    
+    return Response(
+        orjson.dumps({
+            "success": True,
+            "count": len(results),
+            "assessments": [orjson.Fragment(result.model_dump_json()) for result in results]
+        }),
+        media_type="application/json"
+    )
 
 
 @router.get("/assessments")
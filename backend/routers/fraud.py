@@ -1,19 +1,21 @@
-import json
+import asyncio
 import time
 import uuid
 import logging
+import orjson
+from functools import lru_cache
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 
-from schemas.fraud import Transaction, FraudVerdict, Verdict
-from fraud.rule_engine import apply_rules
+from schemas.fraud import Transaction, RuleResult, MLScoreResult, AIAnalysisResult, FraudVerdict, Verdict
+from fraud.rule_engine import apply_rules, apply_rules_batch
 from fraud.ml_scorer import fraud_scorer
 from fraud.llm_analyzer import analyze_transaction
 from database import (
-    save_fraud_transaction,
+    save_fraud_transactions_bulk,
     get_fraud_transactions,
     get_fraud_transaction_by_id,
-    get_processed_transaction_ids,
+    get_processed_transaction_ids_in,
     delete_oldest_fraud_transaction,
     get_fraud_stats
 )
@@ -24,33 +26,65 @@ router = APIRouter(prefix="/api/v1/fraud", tags=["Fraud Detection"])
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 MOCK_FILES = ["mock_transactions.json", "more_mock_transactions.json"]
+MOCK_PATHS = [DATA_DIR / filename for filename in MOCK_FILES]
 
+# Tier 3: AI fraud_type labels that mean no fraud was found
+BENIGN_FRAUD_TYPES = frozenset({"LEGITIMATE", "SAFE", "NORMAL", "NONE", "N/A", ""})
 
-def load_all_mock_transactions() -> list[dict]:
-    all_transactions = []
-    for filename in MOCK_FILES:
-        filepath = DATA_DIR / filename
-        if filepath.exists():
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                all_transactions.extend(data.get("transactions", []))
-    return all_transactions
+# Tier 2: anomaly scores above this are suspicious
+ML_SUSPICIOUS_SCORE = 50
+
+# Tier 1: (verdict, risk_score) indexed by rule flag count, capped at the last entry
+RULE_FLAG_OUTCOMES = (
+    (Verdict.SAFE, 5),
+    (Verdict.SAFE, 15),
+    (Verdict.SAFE, 15),
+    (Verdict.SAFE, 30),
+    (Verdict.SAFE, 30),
+    (Verdict.SUSPICIOUS, 50),
+)
+
+# Upper bound on transactions handled by one /process-batch call
+MAX_BATCH_SIZE = 50
+
+# Serializes pick -> save so concurrent requests never pick the same record
+_process_next_lock = asyncio.Lock()
+
+# Transactions a /process-batch call has picked but not saved yet; /process-next skips them
+_in_flight_transaction_ids: set[str] = set()
 
 
-def process_transaction(txn_dict: dict) -> FraudVerdict:
+@lru_cache(maxsize=4)
+def _load_mock_transactions(mtimes_ns: tuple[int | None, ...]) -> dict[str, tuple[dict, Transaction]]:
+    transactions_by_id = {}
+    for filepath, mtime_ns in zip(MOCK_PATHS, mtimes_ns):
+        if mtime_ns is not None:
+            for txn in orjson.loads(filepath.read_bytes()).get("transactions", []):
+                txn_id = txn.get("transaction_id")
+                if txn_id not in transactions_by_id:
+                    transactions_by_id[txn_id] = (txn, Transaction.model_validate(txn))
+    return transactions_by_id
+
+
+def load_mock_transactions_by_id() -> dict[str, tuple[dict, Transaction]]:
+    # Keyed on file mtimes so edits to the mock data are picked up (and validated once) without a restart
+    return _load_mock_transactions(tuple(
+        filepath.stat().st_mtime_ns if filepath.exists() else None for filepath in MOCK_PATHS
+    ))
+
+
+def process_transaction(txn_dict: dict, txn: Transaction | None = None) -> FraudVerdict:
     start_time = time.perf_counter()
 
-    txn = Transaction.model_validate(txn_dict)
+    if txn is None:
+        txn = Transaction.model_validate(txn_dict)
 
     rule_result = apply_rules(txn)
-    tier_reached = 1
     ml_result = None
     ai_result = None
-    fraud_type = None
 
     if rule_result.pass_to_ml:
         ml_result = fraud_scorer.score(txn)
-        tier_reached = 2
 
         if ml_result.pass_to_llm:
             ai_result = analyze_transaction(
@@ -58,23 +92,52 @@ def process_transaction(txn_dict: dict) -> FraudVerdict:
                 rule_flags=rule_result.flags,
                 ml_score=ml_result.anomaly_score
             )
-            tier_reached = 3
-            fraud_type = ai_result.fraud_type
-
-    # Define known fraud types  
-    FRAUD_TYPES = {
-        "SYNTHETIC_IDENTITY", "MONEY_LAUNDERING", "ACCOUNT_TAKEOVER",
-        "STRUCTURING", "BUST_OUT", "PHISHING_SCAM", "MULE_ACCOUNT",
-        "BUSINESS_EMAIL_COMPROMISE", "CRYPTO_SCAM"
-    }
-    
+
+    return _build_verdict(txn, rule_result, ml_result, ai_result, start_time)
+
+
+async def process_transactions(batch: list[tuple[dict, Transaction]]) -> list[FraudVerdict]:
+    """Batch form of process_transaction: tiers 1-2 run vectorized over the batch, tier 3 fans out."""
+    start_time = time.perf_counter()
+    txns = [txn for _, txn in batch]
+
+    rule_results = apply_rules_batch(txns)
+    ml_results: list[MLScoreResult | None] = [None] * len(batch)
+    to_ml = [i for i, rule_result in enumerate(rule_results) if rule_result.pass_to_ml]
+    for i, ml_result in zip(to_ml, fraud_scorer.score_batch([txns[i] for i in to_ml])):
+        ml_results[i] = ml_result
+
+    # Tier 3 blocks on Gemini, so each analysis gets its own worker thread
+    ai_results: list[AIAnalysisResult | None] = [None] * len(batch)
+    to_llm = [i for i in to_ml if ml_results[i].pass_to_llm]
+    analyses = await asyncio.gather(*(
+        asyncio.to_thread(analyze_transaction, batch[i][0], rule_results[i].flags, ml_results[i].anomaly_score)
+        for i in to_llm
+    ))
+    for i, ai_result in zip(to_llm, analyses):
+        ai_results[i] = ai_result
+
+    return [
+        _build_verdict(txn, rule_result, ml_result, ai_result, start_time)
+        for txn, rule_result, ml_result, ai_result in zip(txns, rule_results, ml_results, ai_results)
+    ]
+
+
+def _build_verdict(
+    txn: Transaction,
+    rule_result: RuleResult,
+    ml_result: MLScoreResult | None,
+    ai_result: AIAnalysisResult | None,
+    start_time: float
+) -> FraudVerdict:
     # Determine verdict based on tier reached
-    if tier_reached == 3 and ai_result:
+    if ai_result:
+        tier_reached = 3
         fraud_type_upper = ai_result.fraud_type.upper()
         
         # Check if AI identified a fraud type
         # If AI identifies actual fraud type, treat it seriously
-        if fraud_type_upper in ["LEGITIMATE", "SAFE", "NORMAL", "NONE", "N/A", ""]:
+        if fraud_type_upper in BENIGN_FRAUD_TYPES:
             # AI says it's legitimate
             verdict = Verdict.SAFE
             risk_score = max(15, min(35, ai_result.confidence // 2))
@@ -86,38 +149,20 @@ def process_transaction(txn_dict: dict) -> FraudVerdict:
             else:
                 verdict = Verdict.SUSPICIOUS
                 risk_score = max(55, min(74, ai_result.confidence))
-    elif tier_reached == 2 and ml_result:
+    elif ml_result:
         # Use ML anomaly score to determine verdict
-        if ml_result.anomaly_score > 65:
-            verdict = Verdict.SUSPICIOUS
-            risk_score = int(ml_result.anomaly_score)
-        elif ml_result.anomaly_score > 50:
-            verdict = Verdict.SUSPICIOUS  # Changed: 50+ is suspicious
-            risk_score = int(ml_result.anomaly_score)
-        elif ml_result.anomaly_score > 30:
-            verdict = Verdict.SAFE
-            risk_score = int(ml_result.anomaly_score)
-        else:
-            verdict = Verdict.SAFE
-            risk_score = int(ml_result.anomaly_score)
+        tier_reached = 2
+        verdict = Verdict.SUSPICIOUS if ml_result.anomaly_score > ML_SUSPICIOUS_SCORE else Verdict.SAFE
+        risk_score = int(ml_result.anomaly_score)
     else:
         # Tier 1 only - based on rule flags
-        if len(rule_result.flags) >= 5:
-            verdict = Verdict.SUSPICIOUS
-            risk_score = 50
-        elif len(rule_result.flags) >= 3:
-            verdict = Verdict.SAFE
-            risk_score = 30
-        elif len(rule_result.flags) >= 1:
-            verdict = Verdict.SAFE
-            risk_score = 15
-        else:
-            verdict = Verdict.SAFE
-            risk_score = 5
+        tier_reached = 1
+        verdict, risk_score = RULE_FLAG_OUTCOMES[min(len(rule_result.flags), len(RULE_FLAG_OUTCOMES) - 1)]
 
     total_time_ms = (time.perf_counter() - start_time) * 1000
 
-    return FraudVerdict(
+    # Every field comes from already-validated models or scorer output, so skip re-validation
+    return FraudVerdict.model_construct(
         transaction_id=txn.transaction_id,
         amount=txn.amount,
         type=txn.type,
@@ -125,7 +170,7 @@ def process_transaction(txn_dict: dict) -> FraudVerdict:
         destination_name=txn.destination.name,
         risk_score=risk_score,
         verdict=verdict,
-        fraud_type=fraud_type,
+        fraud_type=ai_result.fraud_type if ai_result else None,
         tier_reached=tier_reached,
         rule_flags=rule_result.flags,
         ml_score=ml_result.anomaly_score if ml_result else None,
@@ -136,61 +181,96 @@ def process_transaction(txn_dict: dict) -> FraudVerdict:
     )
 
 
+def _verdict_row(verdict: FraudVerdict, txn_dict: dict) -> tuple:
+    """Row for save_fraud_transactions_bulk, in save_fraud_transaction argument order."""
+    return (
+        str(uuid.uuid4()),
+        verdict.transaction_id,
+        verdict.amount,
+        verdict.type,
+        verdict.source_account_id,
+        verdict.destination_name,
+        verdict.risk_score,
+        verdict.verdict.value,
+        verdict.fraud_type,
+        verdict.tier_reached,
+        orjson.dumps(verdict.rule_flags).decode(),
+        verdict.ml_score,
+        orjson.dumps(verdict.ml_features).decode() if verdict.ml_features else None,
+        verdict.ai_analysis.reasoning if verdict.ai_analysis else None,
+        verdict.processing_time_ms,
+        orjson.dumps(txn_dict).decode()
+    )
+
+
 @router.post("/process-next")
 async def process_next_transaction():
-    all_txns = load_all_mock_transactions()
-    if not all_txns:
-        raise HTTPException(status_code=404, detail="No mock transactions found")
-
-    processed_ids = get_processed_transaction_ids()
-
-    next_txn = None
-    for txn in all_txns:
-        if txn.get("transaction_id") not in processed_ids:
-            next_txn = txn
-            break
-
-    if next_txn is None:
-        deleted_id = delete_oldest_fraud_transaction()
-        if deleted_id:
-            for txn in all_txns:
-                if txn.get("transaction_id") == deleted_id:
-                    next_txn = txn
-                    break
-
-        if next_txn is None and all_txns:
-            next_txn = all_txns[0]
-            delete_oldest_fraud_transaction()
-
-    if next_txn is None:
-        raise HTTPException(status_code=404, detail="No transactions available")
-
-    verdict = process_transaction(next_txn)
-
-    record_id = str(uuid.uuid4())
-    save_fraud_transaction(
-        record_id=record_id,
-        transaction_id=verdict.transaction_id,
-        amount=verdict.amount,
-        txn_type=verdict.type,
-        source_account_id=verdict.source_account_id,
-        destination_name=verdict.destination_name,
-        risk_score=verdict.risk_score,
-        verdict=verdict.verdict.value,
-        fraud_type=verdict.fraud_type,
-        tier_reached=verdict.tier_reached,
-        rule_flags=json.dumps(verdict.rule_flags),
-        ml_score=verdict.ml_score,
-        ml_features=json.dumps(verdict.ml_features) if verdict.ml_features else None,
-        ai_reasoning=verdict.ai_analysis.reasoning if verdict.ai_analysis else None,
-        processing_time_ms=verdict.processing_time_ms,
-        transaction_json=json.dumps(next_txn)
+    async with _process_next_lock:
+        txns_by_id = load_mock_transactions_by_id()
+        if not txns_by_id:
+            raise HTTPException(status_code=404, detail="No mock transactions found")
+
+        processed_ids = await asyncio.to_thread(get_processed_transaction_ids_in, list(txns_by_id))
+        processed_ids |= _in_flight_transaction_ids
+        next_entry = next((entry for txn_id, entry in txns_by_id.items() if txn_id not in processed_ids), None)
+
+        if next_entry is None:
+            next_entry = txns_by_id.get(await asyncio.to_thread(delete_oldest_fraud_transaction))
+            if next_entry is None:
+                next_entry = next(
+                    (entry for txn_id, entry in txns_by_id.items() if txn_id not in _in_flight_transaction_ids),
+                    None
+                )
+                if next_entry is None:
+                    raise HTTPException(status_code=409, detail="All mock transactions are in a running batch")
+                await asyncio.to_thread(delete_oldest_fraud_transaction)
+
+        next_txn, txn = next_entry
+        # Tier 3 may block on a Gemini call
+        verdict = await asyncio.to_thread(process_transaction, next_txn, txn)
+
+        await asyncio.to_thread(save_fraud_transactions_bulk, [_verdict_row(verdict, next_txn)])
+
+    return Response(
+        orjson.dumps({"success": True, "transaction": orjson.Fragment(verdict.model_dump_json())}),
+        media_type="application/json"
     )
 
-    return {
-        "success": True,
-        "transaction": verdict.model_dump()
-    }
+
+@router.post("/process-batch")
+async def process_transaction_batch(n: int = Query(10, ge=1, le=MAX_BATCH_SIZE)):
+    """Process up to n unprocessed mock transactions in one call, saving them in a single insert."""
+    async with _process_next_lock:
+        txns_by_id = load_mock_transactions_by_id()
+        if not txns_by_id:
+            raise HTTPException(status_code=404, detail="No mock transactions found")
+
+        processed_ids = await asyncio.to_thread(get_processed_transaction_ids_in, list(txns_by_id))
+        processed_ids |= _in_flight_transaction_ids
+        batch = [entry for txn_id, entry in txns_by_id.items() if txn_id not in processed_ids][:n]
+        batch_ids = {txn.transaction_id for _, txn in batch}
+        _in_flight_transaction_ids.update(batch_ids)
+
+    # The lock is not held across the tier-3 Gemini calls; the in-flight ids keep
+    # /process-next and other batches away from these transactions until they are saved
+    try:
+        verdicts = await process_transactions(batch)
+        if verdicts:
+            async with _process_next_lock:
+                await asyncio.to_thread(save_fraud_transactions_bulk, [
+                    _verdict_row(verdict, txn_dict) for verdict, (txn_dict, _) in zip(verdicts, batch)
+                ])
+    finally:
+        _in_flight_transaction_ids.difference_update(batch_ids)
+
+    return Response(
+        orjson.dumps({
+            "success": True,
+            "count": len(verdicts),
+            "transactions": [orjson.Fragment(verdict.model_dump_json()) for verdict in verdicts]
+        }),
+        media_type="application/json"
+    )
 
 
 @router.get("/transactions")
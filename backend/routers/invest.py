@@ -1,10 +1,11 @@
 """Investment Strategy API Router - Streaming endpoint for strategy generation"""
 
+import asyncio
 import time
-import json
 import uuid
+import orjson
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Literal
@@ -14,11 +15,13 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
 from agents.invest import root_agent
+from agents.invest.prompts import get_strategy_request_prompt
 from database import (
     save_investment_strategy,
     get_investment_strategies,
     get_investment_strategy_by_id
 )
+from routers.streaming import with_keepalive
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,35 @@ router = APIRouter(prefix="/api/v1/invest", tags=["Investment Strategy"])
 
 session_service = InMemorySessionService()
 
+# The coordinator is session-agnostic, so one runner serves every request
+runner = Runner(agent=root_agent, app_name="finguard_invest", session_service=session_service)
+
+STEP_MESSAGES = {
+    "data_search_agent": "Searching for market data and news...",
+    "data_format_agent": "Structuring and analyzing market data...",
+    "visualization_agent": "Generating data visualizations...",
+    "trading_analyst": "Generating trading strategies...",
+    "execution_analyst": "Creating execution plan...",
+    "risk_analyst": "Evaluating risk profile..."
+}
+STEP_INDEX = {step: idx for idx, step in enumerate(STEP_MESSAGES, 1)}
+
+DISCLAIMER = (
+    "This information is for educational and informational purposes only. "
+    "It does not constitute financial advice or investment recommendations. "
+    "Consult a qualified financial advisor before making investment decisions."
+)
+
+
+# Strong references keep background saves alive until they finish
+_pending_saves: set[asyncio.Task] = set()
+
+
+def _on_save_done(task: asyncio.Task) -> None:
+    _pending_saves.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.warning(f"Failed to save strategy to database: {task.exception()}")
+
 
 class StrategyRequest(BaseModel):
     ticker_or_sector: str
@@ -45,8 +77,9 @@ async def generate_strategy(request: StrategyRequest):
         strategy_id = str(uuid.uuid4())
         
         def emit(event_type: str, **data):
-            return json.dumps({"type": event_type, **data}) + "\n"
+            return orjson.dumps({"type": event_type, **data}) + b"\n"
         
+        session = None
         try:
             yield emit("progress", step="starting", message="Initializing strategy generation...")
             
@@ -58,93 +91,46 @@ async def generate_strategy(request: StrategyRequest):
             yield emit("progress", step="data_analyst", status="running", 
                       message="Searching for market data and news...")
             
-            runner = Runner(
-                agent=root_agent,
-                app_name="finguard_invest",
-                session_service=session_service
-            )
-            
-            horizon_text = {
-                "short": "short-term (less than 1 year)",
-                "medium": "medium-term (1-3 years)",
-                "long": "long-term (3+ years)"
-            }
-            
             focus_text = f"\nAdditional focus: {request.focus_areas}" if request.focus_areas else ""
             
-            
-            input_message = f"""Generate an investment strategy with the following parameters:
-
-Ticker/Sector: {request.ticker_or_sector}
-Risk Tolerance: {request.risk_tolerance}
-Investment Horizon: {horizon_text[request.investment_horizon]}
-Focusing on Aspect (if any, else none): {focus_text}
-
-Please proceed through all 5 steps:
-1. Gather raw market data (data_search_agent)
-2. Format data into JSON (data_format_agent)
-3. Develop 3-5 trading strategies (trading_analyst)
-4. Create detailed execution plan (execution_analyst)
-5. Evaluate overall risk (risk_analyst)
-
-Confirm when done."""
+            input_message = get_strategy_request_prompt(
+                request.risk_tolerance, request.investment_horizon
+            ).format(ticker_or_sector=request.ticker_or_sector, focus_text=focus_text)
 
             input_content = types.Content(
                 parts=[types.Part(text=input_message)]
             )
             
             current_step = "data_search_agent"
-            step_order = ["data_search_agent", "data_format_agent", "visualization_agent", "trading_analyst", "execution_analyst", "risk_analyst"]
-            step_messages = {
-                "data_search_agent": "Searching for market data and news...",
-                "data_format_agent": "Structuring and analyzing market data...",
-                "visualization_agent": "Generating data visualizations...",
-                "trading_analyst": "Generating trading strategies...",
-                "execution_analyst": "Creating execution plan...",
-                "risk_analyst": "Evaluating risk profile..."
-            }
             
-            final_output = None
+            # Agent outputs collected from the state deltas as they stream in
+            state = {}
             
             # Emit initial running state for the first step
             yield emit("progress", step=current_step, status="running",
-                      message=step_messages[current_step], 
-                      current=1, total=6)
+                      message=STEP_MESSAGES[current_step], 
+                      current=1, total=len(STEP_INDEX))
             
             async for event in runner.run_async(
                 user_id="invest_user",
                 session_id=session.id,
                 new_message=input_content
             ):
+                state.update(event.actions.state_delta)
+                
                 if event.author and event.author != "user":
-                    agent_name = event.author.lower()
+                    step = event.author.lower()
                     
-                    for step in step_order:
-                        if step in agent_name and step != current_step:
-                            yield emit("progress", step=current_step, status="complete",
-                                      message=f"{step_messages[current_step]} Done")
-                            current_step = step
-                            step_idx = step_order.index(step) + 1
-                            yield emit("progress", step=step, status="running",
-                                      message=step_messages[step], 
-                                      current=step_idx, total=6)
-                            break
-                    
-                    if hasattr(event, 'content') and event.content:
-                        for part in event.content.parts:
-                            if hasattr(part, 'text') and part.text:
-                                final_output = part.text
+                    if step in STEP_INDEX and step != current_step:
+                        yield emit("progress", step=current_step, status="complete",
+                                  message=f"{STEP_MESSAGES[current_step]} Done")
+                        current_step = step
+                        yield emit("progress", step=step, status="running",
+                                  message=STEP_MESSAGES[step], 
+                                  current=STEP_INDEX[step], total=len(STEP_INDEX))
             
             yield emit("progress", step=current_step, status="complete",
-                      message=f"{step_messages.get(current_step, 'Processing')} Done")
-            
-            final_session = await session_service.get_session(
-                app_name="finguard_invest",
-                user_id="invest_user",
-                session_id=session.id
-            )
-            
-            state = final_session.state if final_session else {}
+                      message=f"{STEP_MESSAGES.get(current_step, 'Processing')} Done")
             
             market_analysis = state.get("market_data_analysis_output", {})
             visualization_output = state.get("visualization_output", {})
@@ -159,8 +145,8 @@ Confirm when done."""
                 strategy_output = investment_strategy
                 if isinstance(strategy_output, str):
                     try:
-                        strategy_output = json.loads(strategy_output)
-                    except json.JSONDecodeError:
+                        strategy_output = orjson.loads(strategy_output)
+                    except orjson.JSONDecodeError:
                         pass
                 strategy_output["id"] = strategy_id
                 strategy_output["processing_time"] = processing_time
@@ -177,35 +163,39 @@ Confirm when done."""
                     "execution_plan": execution_plan if isinstance(execution_plan, dict) else {},
                     "risk_assessment": risk_assessment if isinstance(risk_assessment, dict) else {},
                     "processing_time": processing_time,
-                    "disclaimer": (
-                        "This information is for educational and informational purposes only. "
-                        "It does not constitute financial advice or investment recommendations. "
-                        "Consult a qualified financial advisor before making investment decisions."
-                    )
+                    "disclaimer": DISCLAIMER
                 }
             
-            try:
-                save_investment_strategy(
-                    strategy_id=strategy_id,
-                    ticker_or_sector=request.ticker_or_sector,
-                    risk_tolerance=request.risk_tolerance,
-                    investment_horizon=request.investment_horizon,
-                    focus_areas=request.focus_areas,
-                    strategy_name=strategy_output["strategy_name"],
-                    strategy_json=json.dumps(strategy_output),
-                    processing_time=processing_time
-                )
-            except Exception as save_error:
-                logger.warning(f"Failed to save strategy to database: {save_error}")
+            # Persist in the background so the complete event is not held up by the DB write
+            save_task = asyncio.create_task(asyncio.to_thread(
+                save_investment_strategy,
+                strategy_id=strategy_id,
+                ticker_or_sector=request.ticker_or_sector,
+                risk_tolerance=request.risk_tolerance,
+                investment_horizon=request.investment_horizon,
+                focus_areas=request.focus_areas,
+                strategy_name=strategy_output["strategy_name"],
+                strategy_json=orjson.dumps(strategy_output).decode(),
+                processing_time=processing_time
+            ))
+            _pending_saves.add(save_task)
+            save_task.add_done_callback(_on_save_done)
             
             yield emit("complete", strategy=strategy_output, processing_time=processing_time)
             
         except Exception as e:
             logger.exception("Error generating investment strategy")
             yield emit("error", message=str(e))
+        finally:
+            if session:
+                await session_service.delete_session(
+                    app_name="finguard_invest",
+                    user_id="invest_user",
+                    session_id=session.id
+                )
     
     return StreamingResponse(
-        event_generator(),
+        with_keepalive(event_generator()),
         media_type="application/x-ndjson",
         headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
@@ -215,7 +205,7 @@ Confirm when done."""
 async def get_strategy_history(limit: int = 10):
     """Get history of generated strategies"""
     strategies = get_investment_strategies(limit=limit)
-    return {"strategies": strategies}
+    return Response(orjson.dumps({"strategies": strategies}), media_type="application/json")
 
 
 @router.get("/history/{strategy_id}")
@@ -224,4 +214,7 @@ async def get_strategy_detail(strategy_id: str):
     strategy = get_investment_strategy_by_id(strategy_id)
     if not strategy:
         raise HTTPException(status_code=404, detail="Strategy not found")
-    return strategy
+    if strategy.get("strategy_json"):
+        # Embed the stored strategy text verbatim instead of parsing and re-encoding it
+        strategy["strategy_output"] = orjson.Fragment(strategy["strategy_json"])
+    return Response(orjson.dumps(strategy), media_type="application/json")
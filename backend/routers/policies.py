@@ -1,8 +1,12 @@
+import asyncio
+import os
+import shutil
+import tempfile
 import logging
-from pathlib import Path
+from functools import lru_cache
 from fastapi import APIRouter, UploadFile, File, HTTPException
 
-from agents.comply.retriever_agent import list_policy_files, BASE_PATH as POLICIES_BASE_PATH
+from agents.comply.retriever_agent import BASE_PATH as POLICIES_BASE_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -20,25 +24,49 @@ CATEGORY_NAMES = {
 VALID_CATEGORIES = list(CATEGORY_NAMES.keys())
 
 
+def _entry_size(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _category_mtime_ns(category: str) -> int | None:
+    try:
+        return (POLICIES_BASE_PATH / category).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _list_category_policies(category: str, mtime_ns: int | None) -> list[dict]:
+    # Keyed on the category directory mtime, which changes whenever a policy is added or removed
+    if mtime_ns is None:
+        return []
+    with os.scandir(POLICIES_BASE_PATH / category) as entries:
+        return [
+            {"file_name": entry.name, "file_size": _entry_size(entry)}
+            for entry in entries
+            if entry.name.endswith(".pdf")
+        ]
+
+
+def _scan_category(category: str) -> list[dict]:
+    return _list_category_policies(category, _category_mtime_ns(category))
+
+
 @router.get("/policies")
 async def list_all_policies():
     """List all bank policies organized by category."""
-    result = {}
-    
-    for category in VALID_CATEGORIES:
-        policies = list_policy_files(category)
-        result[category] = {
+    # Category directories are independent, so scan them concurrently off the event loop
+    listings = await asyncio.gather(*(asyncio.to_thread(_scan_category, category) for category in VALID_CATEGORIES))
+    return {
+        category: {
             "name": CATEGORY_NAMES.get(category, category),
-            "policies": [
-                {
-                    "file_name": p["file_name"],
-                    "file_size": Path(p["file_path"]).stat().st_size if Path(p["file_path"]).exists() else 0
-                }
-                for p in policies
-            ]
+            "policies": policies
         }
-    
-    return result
+        for category, policies in zip(VALID_CATEGORIES, listings)
+    }
 
 
 @router.post("/policies/{category}")
@@ -55,12 +83,15 @@ async def upload_policy(category: str, file: UploadFile = File(...)):
     
     file_path = category_path / file.filename
     
-    if file_path.exists():
-        raise HTTPException(status_code=400, detail=f"Policy '{file.filename}' already exists in {category}")
-    
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
+    # Write beside the target, then hard-link it into place: the link fails if the name is taken,
+    # so concurrent uploads cannot clobber each other and a half-written PDF is never listed
+    with tempfile.NamedTemporaryFile(dir=category_path, suffix=".upload") as tmp:
+        await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, 1 << 20)
+        tmp.flush()
+        try:
+            os.link(tmp.name, file_path)
+        except FileExistsError:
+            raise HTTPException(status_code=400, detail=f"Policy '{file.filename}' already exists in {category}") from None
     
     logger.info(f"[POLICY] Uploaded {file.filename} to {category}")
     
@@ -0,0 +1,31 @@
+import asyncio
+
+# Seconds of silence after which a stream sends a blank keep-alive line
+KEEPALIVE_INTERVAL = 15
+
+
+async def with_keepalive(events):
+    """Forward events, emitting a blank NDJSON line whenever the producer is quiet for too long."""
+    queue = asyncio.Queue()
+    
+    async def produce():
+        try:
+            async for item in events:
+                queue.put_nowait(item)
+        finally:
+            queue.put_nowait(None)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+            except TimeoutError:
+                yield b"\n"
+                continue
+            if item is None:
+                break
+            yield item
+        await producer
+    finally:
+        producer.cancel()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from enum import Enum
 
@@ -10,6 +10,8 @@ class RiskBand(str, Enum):
 
 
 class CreditApplicant(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     age: int
     occupation: str
@@ -41,6 +43,8 @@ class CreditDecision(BaseModel):
 
 
 class CreditAssessmentResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     assessment_id: str
     timestamp: str
     applicant: CreditApplicant
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from enum import Enum
 
@@ -54,6 +54,8 @@ class RiskSignals(BaseModel):
 
 
 class Transaction(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     transaction_id: str
     reference_id: str
     timestamp: str
@@ -70,12 +72,16 @@ class Transaction(BaseModel):
 
 
 class RuleResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     flags: list[str]
     pass_to_ml: bool
     processing_time_ms: float
 
 
 class MLScoreResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     anomaly_score: float
     feature_contributions: dict[str, float]
     pass_to_llm: bool
@@ -91,6 +97,8 @@ class AIAnalysisResult(BaseModel):
 
 
 class FraudVerdict(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     transaction_id: str
     amount: float
     type: str
@@ -1,10 +1,16 @@
 """Pydantic schemas for investment strategy module - All agent outputs"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Literal
 from enum import Enum
 
 
+# Validators and JSON schemas are built on first use rather than at import, keeping
+# worker startup off the cost of schemas only the invest pipeline needs.
+class _DeferredModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+
 class Sentiment(str, Enum):
     BULLISH = "BULLISH"
     BEARISH = "BEARISH"
@@ -30,24 +36,24 @@ class ChartType(str, Enum):
     GAUGE = "gauge"
 
 
-class ChartAnnotation(BaseModel):
+class ChartAnnotation(_DeferredModel):
     value: float = Field(description="Value for the annotation line")
     label: str = Field(description="Label for the annotation")
 
 
-class ChartData(BaseModel):
+class ChartData(_DeferredModel):
     labels: Optional[List[str]] = Field(None, description="X-axis labels or categories")
     values: List[float] = Field(description="Primary data values")
     secondary_values: Optional[List[float]] = Field(None, description="Secondary series for comparison")
     annotations: Optional[List[ChartAnnotation]] = Field(None, description="Reference lines or targets")
 
 
-class ChartMeta(BaseModel):
+class ChartMeta(_DeferredModel):
     unit: Optional[str] = Field(None, description="Unit symbol like $ or %")
     positive_is_good: bool = Field(default=True, description="Whether positive values are good (for coloring)")
 
 
-class Visualization(BaseModel):
+class Visualization(_DeferredModel):
     type: ChartType = Field(description="Chart type to render")
     title: str = Field(description="Chart title")
     description: Optional[str] = Field(None, description="What insight this chart shows")
@@ -55,19 +61,19 @@ class Visualization(BaseModel):
     meta: Optional[ChartMeta] = Field(None, description="Display metadata")
 
 
-class VisualizationOutput(BaseModel):
+class VisualizationOutput(_DeferredModel):
     visualizations: List[Visualization] = Field(description="List of charts to render")
     reasoning: str = Field(description="Why these visualizations were chosen")
 
 
-class NewsItem(BaseModel):
+class NewsItem(_DeferredModel):
     headline: str = Field(description="News headline")
     source: str = Field(description="Source publication")
     date: Optional[str] = Field(None, description="Publication date if available")
     relevance: str = Field(description="Why this news is relevant")
 
 
-class MarketDataAnalysisOutput(BaseModel):
+class MarketDataAnalysisOutput(_DeferredModel):
     """Output schema for Data Analyst agent - includes numerical data from yfinance"""
     ticker_or_sector: str = Field(description="The analyzed ticker or sector")
     report_date: str = Field(description="Date of this analysis")
@@ -101,7 +107,7 @@ class MarketDataAnalysisOutput(BaseModel):
     sources_count: int = Field(description="Number of sources consulted")
 
 
-class TradingStrategy(BaseModel):
+class TradingStrategy(_DeferredModel):
     """Single trading strategy"""
     strategy_name: str = Field(description="Descriptive name for the strategy")
     description: str = Field(description="Core idea and rationale")
@@ -113,7 +119,7 @@ class TradingStrategy(BaseModel):
     is_recommended: bool = Field(default=False, description="Top recommended strategy")
 
 
-class TradingStrategiesOutput(BaseModel):
+class TradingStrategiesOutput(_DeferredModel):
     """Output schema for Trading Analyst agent"""
     ticker_or_sector: str = Field(description="The analyzed ticker or sector")
     risk_tolerance: str = Field(description="User's risk tolerance")
@@ -122,7 +128,7 @@ class TradingStrategiesOutput(BaseModel):
     overall_approach: str = Field(description="Summary of the overall approach")
 
 
-class StrategyExecution(BaseModel):
+class StrategyExecution(_DeferredModel):
     """Execution details for a single strategy"""
     strategy_name: str = Field(description="Name of the strategy")
     order_types: str = Field(description="Recommended order types")
@@ -133,7 +139,7 @@ class StrategyExecution(BaseModel):
     management: str = Field(description="Ongoing position management")
 
 
-class ExecutionPlanOutput(BaseModel):
+class ExecutionPlanOutput(_DeferredModel):
     """Output schema for Execution Analyst agent"""
     general_principles: List[str] = Field(description="General execution principles")
     risk_management_approach: str = Field(description="Overall risk management")
@@ -142,14 +148,14 @@ class ExecutionPlanOutput(BaseModel):
     strategy_executions: List[StrategyExecution] = Field(description="Per-strategy execution plans")
 
 
-class StrategyRisk(BaseModel):
+class StrategyRisk(_DeferredModel):
     """Risk assessment for a single strategy"""
     strategy_name: str = Field(description="Name of the strategy")
     risk_level: RiskLevel = Field(description="Risk level for this strategy")
     key_risks: List[str] = Field(description="Key risks specific to this strategy")
 
 
-class RiskAssessmentOutput(BaseModel):
+class RiskAssessmentOutput(_DeferredModel):
     """Output schema for Risk Analyst agent"""
     overall_risk_level: RiskLevel = Field(description="Overall risk level")
     risk_summary: List[str] = Field(description="Key risk factors as bullet points")
@@ -161,7 +167,7 @@ class RiskAssessmentOutput(BaseModel):
     mitigation_recommendations: List[str] = Field(description="Risk mitigation suggestions")
 
 
-class InvestmentStrategyOutput(BaseModel):
+class InvestmentStrategyOutput(_DeferredModel):
     """Final output schema for Investment Coordinator agent"""
     strategy_name: str = Field(description="Name for this investment strategy")
     ticker_or_sector: str = Field(description="What was analyzed")
@@ -177,7 +183,7 @@ class InvestmentStrategyOutput(BaseModel):
     )
 
 
-class StrategyRequest(BaseModel):
+class StrategyRequest(_DeferredModel):
     """Input request for strategy generation"""
     ticker_or_sector: str = Field(..., description="Stock ticker or sector to analyze")
     risk_tolerance: Literal["conservative", "moderate", "aggressive"] = Field(
@@ -191,7 +197,7 @@ class StrategyRequest(BaseModel):
     )
 
 
-class StrategyHistoryItem(BaseModel):
+class StrategyHistoryItem(_DeferredModel):
     """Summary item for strategy history list"""
     id: str
     ticker_or_sector: str
@@ -2,6 +2,7 @@
 
 from .yfinance_tools import (
     get_stock_quote,
+    get_stock_quotes,
     get_stock_fundamentals,
     get_price_history,
     get_analyst_ratings,
@@ -9,6 +10,7 @@ from .yfinance_tools import (
 
 __all__ = [
     "get_stock_quote",
+    "get_stock_quotes",
     "get_stock_fundamentals",
     "get_price_history",
     "get_analyst_ratings",
@@ -4,9 +4,88 @@ yfinance Tools for Investment Strategy Agents
 Provides real financial data from Yahoo Finance API.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import numpy as np
 import yfinance as yf
 from datetime import datetime
 
+# yfinance memoizes .info and .recommendations on each Ticker instance, so sharing
+# instances lets every tool call for a symbol reuse one Yahoo round trip.
+TICKER_TTL_SECONDS = 60
+_ticker_cache: dict[str, tuple[float, yf.Ticker]] = {}
+_ticker_cache_lock = Lock()
+
+
+def _get_ticker(ticker: str) -> yf.Ticker:
+    symbol = ticker.upper()
+    now = time.monotonic()
+    with _ticker_cache_lock:
+        entry = _ticker_cache.get(symbol)
+        if entry and entry[0] > now:
+            return entry[1]
+        for key in [key for key, (expires_at, _) in _ticker_cache.items() if expires_at <= now]:
+            del _ticker_cache[key]
+        stock = yf.Ticker(symbol)
+        _ticker_cache[symbol] = (now + TICKER_TTL_SECONDS, stock)
+        return stock
+
+
+# (output field, stock.info key) pairs, in response order
+QUOTE_FIELDS = (
+    ("market_cap", "marketCap"),
+    ("pe_ratio", "trailingPE"),
+    ("forward_pe", "forwardPE"),
+    ("week_52_high", "fiftyTwoWeekHigh"),
+    ("week_52_low", "fiftyTwoWeekLow"),
+    ("volume", "volume"),
+    ("avg_volume", "averageVolume"),
+    ("dividend_yield", "dividendYield"),
+    ("beta", "beta"),
+    ("currency", "currency"),
+    ("exchange", "exchange"),
+)
+FUNDAMENTAL_FIELDS = (
+    ("company_name", "longName"),
+    ("sector", "sector"),
+    ("industry", "industry"),
+    ("revenue", "totalRevenue"),
+    ("revenue_per_share", "revenuePerShare"),
+    ("gross_margins", "grossMargins"),
+    ("operating_margins", "operatingMargins"),
+    ("profit_margins", "profitMargins"),
+    ("earnings_per_share", "trailingEps"),
+    ("forward_eps", "forwardEps"),
+    ("book_value", "bookValue"),
+    ("price_to_book", "priceToBook"),
+    ("debt_to_equity", "debtToEquity"),
+    ("current_ratio", "currentRatio"),
+    ("quick_ratio", "quickRatio"),
+    ("return_on_equity", "returnOnEquity"),
+    ("return_on_assets", "returnOnAssets"),
+    ("free_cash_flow", "freeCashflow"),
+    ("operating_cash_flow", "operatingCashflow"),
+    ("earnings_growth", "earningsGrowth"),
+    ("revenue_growth", "revenueGrowth"),
+    ("target_mean_price", "targetMeanPrice"),
+    ("recommendation_key", "recommendationKey"),
+)
+ANALYST_FIELDS = (
+    ("target_low_price", "targetLowPrice"),
+    ("target_mean_price", "targetMeanPrice"),
+    ("target_median_price", "targetMedianPrice"),
+    ("target_high_price", "targetHighPrice"),
+    ("number_of_analysts", "numberOfAnalystOpinions"),
+    ("recommendation_key", "recommendationKey"),
+    ("recommendation_mean", "recommendationMean"),
+)
+
+
+def _pick(info: dict, fields: tuple[tuple[str, str], ...]) -> dict:
+    return {name: info.get(key) for name, key in fields}
+
 
 def get_stock_quote(ticker: str) -> dict:
     """Get current quote and key metrics for a stock.
@@ -18,7 +97,7 @@ def get_stock_quote(ticker: str) -> dict:
         Dictionary with current price, change, market cap, P/E, 52-week range, volume
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _get_ticker(ticker)
         info = stock.info
         
         current_price = info.get("currentPrice") or info.get("regularMarketPrice")
@@ -38,17 +117,7 @@ def get_stock_quote(ticker: str) -> dict:
             "previous_close": previous_close,
             "price_change": price_change,
             "price_change_percent": price_change_percent,
-            "market_cap": info.get("marketCap"),
-            "pe_ratio": info.get("trailingPE"),
-            "forward_pe": info.get("forwardPE"),
-            "week_52_high": info.get("fiftyTwoWeekHigh"),
-            "week_52_low": info.get("fiftyTwoWeekLow"),
-            "volume": info.get("volume"),
-            "avg_volume": info.get("averageVolume"),
-            "dividend_yield": info.get("dividendYield"),
-            "beta": info.get("beta"),
-            "currency": info.get("currency"),
-            "exchange": info.get("exchange"),
+            **_pick(info, QUOTE_FIELDS),
         }
     except Exception as e:
         return {
@@ -57,6 +126,22 @@ def get_stock_quote(ticker: str) -> dict:
         }
 
 
+def get_stock_quotes(tickers: list[str]) -> dict:
+    """Get current quotes for several stocks at once.
+    
+    Args:
+        tickers: Stock ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"])
+    
+    Returns:
+        Dictionary with one get_stock_quote result per ticker, in the order given
+    """
+    if not tickers:
+        return {"status": "error", "error_message": "No tickers provided"}
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        quotes = list(executor.map(get_stock_quote, tickers))
+    return {"status": "success", "quotes": quotes}
+
+
 def get_stock_fundamentals(ticker: str) -> dict:
     """Get financial statement data and key ratios for a stock.
     
@@ -67,35 +152,13 @@ def get_stock_fundamentals(ticker: str) -> dict:
         Dictionary with revenue, earnings, margins, debt ratios, and growth metrics
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _get_ticker(ticker)
         info = stock.info
         
         return {
             "status": "success",
             "ticker": ticker.upper(),
-            "company_name": info.get("longName"),
-            "sector": info.get("sector"),
-            "industry": info.get("industry"),
-            "revenue": info.get("totalRevenue"),
-            "revenue_per_share": info.get("revenuePerShare"),
-            "gross_margins": info.get("grossMargins"),
-            "operating_margins": info.get("operatingMargins"),
-            "profit_margins": info.get("profitMargins"),
-            "earnings_per_share": info.get("trailingEps"),
-            "forward_eps": info.get("forwardEps"),
-            "book_value": info.get("bookValue"),
-            "price_to_book": info.get("priceToBook"),
-            "debt_to_equity": info.get("debtToEquity"),
-            "current_ratio": info.get("currentRatio"),
-            "quick_ratio": info.get("quickRatio"),
-            "return_on_equity": info.get("returnOnEquity"),
-            "return_on_assets": info.get("returnOnAssets"),
-            "free_cash_flow": info.get("freeCashflow"),
-            "operating_cash_flow": info.get("operatingCashflow"),
-            "earnings_growth": info.get("earningsGrowth"),
-            "revenue_growth": info.get("revenueGrowth"),
-            "target_mean_price": info.get("targetMeanPrice"),
-            "recommendation_key": info.get("recommendationKey"),
+            **_pick(info, FUNDAMENTAL_FIELDS),
         }
     except Exception as e:
         return {
@@ -115,7 +178,7 @@ def get_price_history(ticker: str, period: str) -> dict:
         Dictionary with OHLCV arrays and calculated metrics
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _get_ticker(ticker)
         hist = stock.history(period=period)
         
         if hist.empty:
@@ -124,22 +187,20 @@ def get_price_history(ticker: str, period: str) -> dict:
                 "error_message": f"No historical data found for {ticker}"
             }
         
-        closes = hist["Close"].tolist()
+        closes = hist["Close"].to_numpy()
         dates = hist.index.strftime("%Y-%m-%d").tolist()
+        opens, highs, lows, prices = np.round(hist[["Open", "High", "Low", "Close"]].to_numpy(), 2).T
         
         sma_20 = None
         sma_50 = None
         if len(closes) >= 20:
-            sma_20 = round(sum(closes[-20:]) / 20, 2)
+            sma_20 = round(float(closes[-20:].mean()), 2)
         if len(closes) >= 50:
-            sma_50 = round(sum(closes[-50:]) / 50, 2)
+            sma_50 = round(float(closes[-50:].mean()), 2)
         
         period_return = None
         if len(closes) >= 2:
-            period_return = round(((closes[-1] - closes[0]) / closes[0]) * 100, 2)
-        
-        high_in_period = round(max(closes), 2)
-        low_in_period = round(min(closes), 2)
+            period_return = round(float((closes[-1] - closes[0]) / closes[0] * 100), 2)
         
         return {
             "status": "success",
@@ -147,14 +208,14 @@ def get_price_history(ticker: str, period: str) -> dict:
             "period": period,
             "data_points": len(closes),
             "dates": dates,
-            "prices": [round(p, 2) for p in closes],
+            "prices": prices.tolist(),
             "volumes": hist["Volume"].tolist(),
-            "highs": [round(h, 2) for h in hist["High"].tolist()],
-            "lows": [round(l, 2) for l in hist["Low"].tolist()],
-            "opens": [round(o, 2) for o in hist["Open"].tolist()],
-            "current_price": round(closes[-1], 2) if closes else None,
-            "period_high": high_in_period,
-            "period_low": low_in_period,
+            "highs": highs.tolist(),
+            "lows": lows.tolist(),
+            "opens": opens.tolist(),
+            "current_price": round(float(closes[-1]), 2),
+            "period_high": round(float(closes.max()), 2),
+            "period_low": round(float(closes.min()), 2),
             "period_return_percent": period_return,
             "sma_20": sma_20,
             "sma_50": sma_50,
@@ -176,7 +237,7 @@ def get_analyst_ratings(ticker: str) -> dict:
         Dictionary with analyst targets, recommendations, and rating distribution
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _get_ticker(ticker)
         info = stock.info
         
         recommendations = None
@@ -193,13 +254,7 @@ def get_analyst_ratings(ticker: str) -> dict:
             "ticker": ticker.upper(),
             "company_name": info.get("longName"),
             "current_price": info.get("currentPrice") or info.get("regularMarketPrice"),
-            "target_low_price": info.get("targetLowPrice"),
-            "target_mean_price": info.get("targetMeanPrice"),
-            "target_median_price": info.get("targetMedianPrice"),
-            "target_high_price": info.get("targetHighPrice"),
-            "number_of_analysts": info.get("numberOfAnalystOpinions"),
-            "recommendation_key": info.get("recommendationKey"),
-            "recommendation_mean": info.get("recommendationMean"),
+            **_pick(info, ANALYST_FIELDS),
             "recent_recommendations": recommendations,
         }
     except Exception as e:
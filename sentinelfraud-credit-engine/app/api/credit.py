@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Query
+import orjson
+from fastapi import APIRouter, Query, Response
 from app.models import CreditRequest
 from app.scoring.rule_engine import rule_score, enhanced_rule_score
 from app.scoring.feature_mapper import to_ml_features
@@ -129,7 +130,7 @@ def assess(req: CreditRequest, include_explanation: bool = Query(False)):
         explanation = generate_explanation(decision)
         response["customer_explanation"] = explanation
     
-    return response
+    return Response(orjson.dumps(response), media_type="application/json")
 
 
 @router.post("/credit/explain")
@@ -172,12 +173,15 @@ def explain(req: CreditRequest):
     
     explanation = generate_explanation(decision)
     
-    return {
-        "user_id": req.user_id,
-        "risk_band": band,
-        "email": explanation["email"],
-        "sms": explanation["sms"]
-    }
+    return Response(
+        orjson.dumps({
+            "user_id": req.user_id,
+            "risk_band": band,
+            "email": explanation["email"],
+            "sms": explanation["sms"]
+        }),
+        media_type="application/json"
+    )
 
 
 @router.post("/credit/assess/full")
@@ -236,7 +240,7 @@ def assess_full(req: CreditRequest):
     
     reason_codes = generate_reason_codes(req)
     
-    return {
+    response = {
         "assessment_id": f"CR-FULL-{req.user_id}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
         "timestamp": datetime.now().isoformat(),
         
@@ -315,6 +319,8 @@ def assess_full(req: CreditRequest):
         # Key Contributing Factors (Top 3)
         "key_factors": _extract_key_factors(full_result, reason_codes, prob)
     }
+    
+    return Response(orjson.dumps(response), media_type="application/json")
 
 
 def _extract_key_factors(full_result: dict, reason_codes: list, ml_prob: float) -> list:
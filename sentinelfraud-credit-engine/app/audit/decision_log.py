@@ -1,9 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 def log_decision(user_id, score, risk_band):
     return {
         "user_id": user_id,
         "score": score,
         "risk_band": risk_band,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
@@ -1,21 +1,25 @@
 import joblib
+import numpy as np
 
 bundle = joblib.load("app/artifacts/credit_model.joblib")
 model = bundle["model"]
 MODEL_AUC = bundle.get("auc", None)
 
+# Index for 'High' class (2); None falls back to the max probability
+_HIGH_IDX = model.classes_.tolist().index(2) if 2 in model.classes_ else None
+
+# Warm predict_proba so the first request does not pay sklearn's first-call setup
+model.predict_proba(np.zeros((1, model.n_features_in_)))
+
 
 def ml_score(features):
     # features: a list of values in the same order used in training
-    probs = model.predict_proba([features])[0]
-    # Find index for 'High' class (2);
-    if 2 in list(model.classes_):
-        high_idx = list(model.classes_).index(2)
-        prob_high = float(probs[high_idx])
-    else:
-        # fallback to max probability if classes aren't labeled as 2
-        prob_high = float(max(probs))
+    probs, scores = ml_score_batch([features])
+    return float(probs[0]), int(scores[0])
 
-    score = int(prob_high * 1000)
-    return prob_high, score
 
+def ml_score_batch(features_2d):
+    # features_2d: one feature row per applicant, columns in training order
+    probs = model.predict_proba(np.asarray(features_2d, dtype=np.float64))
+    prob_high = probs[:, _HIGH_IDX] if _HIGH_IDX is not None else probs.max(axis=1)
+    return prob_high, (prob_high * 1000).astype(np.int64)
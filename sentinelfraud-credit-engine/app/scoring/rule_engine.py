@@ -1,5 +1,55 @@
 from typing import Optional
 from .network_score import compute_network_adjustments
+from .stability_scores import (
+    compute_income_rhythm,
+    compute_savings_cadence,
+    compute_device_persistence,
+    compute_expense_elasticity,
+    compute_utility_stability,
+    compute_merchant_loyalty,
+    compute_repayment_velocity,
+    compute_geo_resilience,
+    compute_stability_composite
+)
+
+# Request fields in compute_network_adjustments parameter order
+NETWORK_FIELDS = (
+    'avg_contact_credit_score',
+    'low_risk_contact_ratio',
+    'high_risk_contact_ratio',
+    'network_stability_ratio',
+    'address_change_count_12m',
+    'current_address_tenure_months',
+)
+
+# (signal name, compute function, request fields in parameter order,
+#  breakdown label, result attribute reported under that label)
+SIGNAL_SPECS = (
+    ('income_rhythm', compute_income_rhythm,
+     ('income_coefficient_of_variation', 'seasonal_adjustment_factor', 'income_frequency_months'),
+     'category', 'rhythm_category'),
+    ('savings_cadence', compute_savings_cadence,
+     ('micro_saves_per_month', 'savings_persistence_months', 'has_escrow_commitment'),
+     'category', 'cadence_category'),
+    ('device_persistence', compute_device_persistence,
+     ('device_tenure_months', 'os_change_count_12m', 'app_reinstall_count'),
+     'trust_level', 'trust_level'),
+    ('expense_elasticity', compute_expense_elasticity,
+     ('expense_income_correlation', 'expense_volatility'),
+     'type', 'elasticity_type'),
+    ('utility_stability', compute_utility_stability,
+     ('utility_payment_ontime_ratio', 'utility_payment_variance', 'utility_months_active'),
+     'pattern', 'payment_pattern'),
+    ('merchant_loyalty', compute_merchant_loyalty,
+     ('repeat_merchant_ratio', 'refund_ratio', 'dispute_frequency'),
+     'tier', 'loyalty_tier'),
+    ('repayment_velocity', compute_repayment_velocity,
+     ('early_payment_ratio', 'ontime_payment_ratio', 'late_payment_ratio'),
+     'category', 'velocity_category'),
+    ('geo_resilience', compute_geo_resilience,
+     ('local_economic_index', 'income_local_correlation', 'employment_diversity_score'),
+     'level', 'resilience_level'),
+)
 
 
 def rule_score(req):
@@ -53,14 +103,8 @@ def enhanced_rule_score(req) -> dict:
     base_score = rule_score(req)
     
     # Extract optional network/address fields with None defaults
-    network_result = compute_network_adjustments(
-        avg_contact_credit_score=getattr(req, 'avg_contact_credit_score', None),
-        low_risk_contact_ratio=getattr(req, 'low_risk_contact_ratio', None),
-        high_risk_contact_ratio=getattr(req, 'high_risk_contact_ratio', None),
-        network_stability_ratio=getattr(req, 'network_stability_ratio', None),
-        address_change_count_12m=getattr(req, 'address_change_count_12m', None),
-        current_address_tenure_months=getattr(req, 'current_address_tenure_months', None)
-    )
+    fields = vars(req)
+    network_result = compute_network_adjustments(*map(fields.get, NETWORK_FIELDS))
     
     ctc = network_result["ctc"]
     address = network_result["address_stability"]
@@ -107,81 +151,17 @@ def fully_enhanced_rule_score(req) -> dict:
     Returns:
         dict with complete breakdown for explainability
     """
-    from .stability_scores import (
-        compute_income_rhythm,
-        compute_savings_cadence,
-        compute_device_persistence,
-        compute_expense_elasticity,
-        compute_utility_stability,
-        compute_merchant_loyalty,
-        compute_repayment_velocity,
-        compute_geo_resilience,
-        compute_stability_composite
-    )
-    
     # Get base enhanced score (includes CTC and address)
     enhanced = enhanced_rule_score(req)
     base_with_network = enhanced["adjusted_score"]
     
     # Compute all stability signals
-    income_rhythm = compute_income_rhythm(
-        income_coefficient_of_variation=getattr(req, 'income_coefficient_of_variation', None),
-        seasonal_adjustment_factor=getattr(req, 'seasonal_adjustment_factor', None),
-        income_frequency_months=getattr(req, 'income_frequency_months', None)
-    )
-    
-    savings_cadence = compute_savings_cadence(
-        micro_saves_per_month=getattr(req, 'micro_saves_per_month', None),
-        savings_persistence_months=getattr(req, 'savings_persistence_months', None),
-        has_escrow_commitment=getattr(req, 'has_escrow_commitment', None)
-    )
-    
-    device_persistence = compute_device_persistence(
-        device_tenure_months=getattr(req, 'device_tenure_months', None),
-        os_change_count_12m=getattr(req, 'os_change_count_12m', None),
-        app_reinstall_count=getattr(req, 'app_reinstall_count', None)
-    )
-    
-    expense_elasticity = compute_expense_elasticity(
-        expense_income_correlation=getattr(req, 'expense_income_correlation', None),
-        expense_volatility=getattr(req, 'expense_volatility', None)
-    )
-    
-    utility_stability = compute_utility_stability(
-        utility_payment_ontime_ratio=getattr(req, 'utility_payment_ontime_ratio', None),
-        utility_payment_variance=getattr(req, 'utility_payment_variance', None),
-        utility_months_active=getattr(req, 'utility_months_active', None)
-    )
-    
-    merchant_loyalty = compute_merchant_loyalty(
-        repeat_merchant_ratio=getattr(req, 'repeat_merchant_ratio', None),
-        refund_ratio=getattr(req, 'refund_ratio', None),
-        dispute_frequency=getattr(req, 'dispute_frequency', None)
-    )
-    
-    repayment_velocity = compute_repayment_velocity(
-        early_payment_ratio=getattr(req, 'early_payment_ratio', None),
-        ontime_payment_ratio=getattr(req, 'ontime_payment_ratio', None),
-        late_payment_ratio=getattr(req, 'late_payment_ratio', None)
-    )
-    
-    geo_resilience = compute_geo_resilience(
-        local_economic_index=getattr(req, 'local_economic_index', None),
-        income_local_correlation=getattr(req, 'income_local_correlation', None),
-        employment_diversity_score=getattr(req, 'employment_diversity_score', None)
-    )
-    
-    # Compute stability composite
-    stability_composite = compute_stability_composite(
-        income_rhythm=income_rhythm,
-        savings_cadence=savings_cadence,
-        device_persistence=device_persistence,
-        expense_elasticity=expense_elasticity,
-        utility_stability=utility_stability,
-        merchant_loyalty=merchant_loyalty,
-        repayment_velocity=repayment_velocity,
-        geo_resilience=geo_resilience
-    )
+    fields = vars(req)
+    signals = {
+        name: compute(*map(fields.get, keys))
+        for name, compute, keys, _, _ in SIGNAL_SPECS
+    }
+    stability_composite = compute_stability_composite(**signals)
     
     # Apply stability adjustment (higher stability = lower risk, so subtract)
     stability_adjustment = -stability_composite["total_adjustment"]
@@ -217,45 +197,11 @@ def fully_enhanced_rule_score(req) -> dict:
         
         # Individual signal results for explainability
         "signal_breakdown": {
-            "income_rhythm": {
-                "score": income_rhythm.score,
-                "available": income_rhythm.available,
-                "category": income_rhythm.rhythm_category
-            },
-            "savings_cadence": {
-                "score": savings_cadence.score,
-                "available": savings_cadence.available,
-                "category": savings_cadence.cadence_category
-            },
-            "device_persistence": {
-                "score": device_persistence.score,
-                "available": device_persistence.available,
-                "trust_level": device_persistence.trust_level
-            },
-            "expense_elasticity": {
-                "score": expense_elasticity.score,
-                "available": expense_elasticity.available,
-                "type": expense_elasticity.elasticity_type
-            },
-            "utility_stability": {
-                "score": utility_stability.score,
-                "available": utility_stability.available,
-                "pattern": utility_stability.payment_pattern
-            },
-            "merchant_loyalty": {
-                "score": merchant_loyalty.score,
-                "available": merchant_loyalty.available,
-                "tier": merchant_loyalty.loyalty_tier
-            },
-            "repayment_velocity": {
-                "score": repayment_velocity.score,
-                "available": repayment_velocity.available,
-                "category": repayment_velocity.velocity_category
-            },
-            "geo_resilience": {
-                "score": geo_resilience.score,
-                "available": geo_resilience.available,
-                "level": geo_resilience.resilience_level
+            name: {
+                "score": signals[name].score,
+                "available": signals[name].available,
+                label: getattr(signals[name], attr)
             }
+            for name, _, _, label, attr in SIGNAL_SPECS
         }
     }
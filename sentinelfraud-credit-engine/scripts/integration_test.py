@@ -1,5 +1,7 @@
+import argparse
 import json
 import sys
+import time
 
 from fastapi.testclient import TestClient
 from app.main import app
@@ -29,9 +31,30 @@ def run_test():
     print(json.dumps(data, indent=2))
 
 
+def run_benchmark(iterations):
+    # Send the file bytes as-is so the loop measures the app, not client-side JSON encoding
+    with open("sample_request.json", "rb") as f:
+        body = f.read()
+    headers = {"content-type": "application/json"}
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        resp = client.post("/credit/assess", content=body, headers=headers)
+        assert resp.status_code == 200, f"Unexpected status: {resp.status_code} - {resp.text}"
+    elapsed = time.perf_counter() - start
+
+    print(f"{iterations} requests in {elapsed:.2f}s ({iterations / elapsed:.0f} req/s)")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=0, help="repeat /credit/assess N times and report throughput")
+    args = parser.parse_args()
     try:
-        run_test()
+        if args.n:
+            run_benchmark(args.n)
+        else:
+            run_test()
     except AssertionError as e:
         print("TEST FAILED:", e)
         sys.exit(2)